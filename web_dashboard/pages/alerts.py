@@ -103,8 +103,7 @@ def render(loader):
 
                             latest_date = loader.get_latest_date(ticker)
                             if latest_date:
-                                decision_content = loader.read_report(ticker, latest_date, "final_trade_decision")
-                                current_decision = loader.extract_decision(decision_content)
+                                current_decision = loader.read_decision(ticker, latest_date)
 
                                 if current_decision:
                                     is_triggered = check_decision_alert(ticker, current_decision, target_decision)
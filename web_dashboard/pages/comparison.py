@@ -11,7 +11,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.export_utils import prepare_export_data
-from utils.logo_utils import display_ticker_with_logo
+from utils.logo_utils import display_ticker_with_logo, get_logos_bulk
 
 
 def create_price_comparison_chart(tickers: list, period: str = "1mo"):
@@ -162,6 +162,7 @@ def render(loader):
 
             st.subheader("Summary Table")
 
+            get_logos_bulk(selected_tickers)
             for ticker in selected_tickers:
                 ticker_html = display_ticker_with_logo(ticker, size=16)
                 st.markdown(ticker_html, unsafe_allow_html=True)
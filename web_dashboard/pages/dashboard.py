@@ -11,8 +11,8 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils.logo_utils import display_ticker_with_logo, create_ticker_badge
-from utils.news_utils import fetch_all_news, render_news_card, get_sentiment_emoji
+from utils.logo_utils import display_ticker_with_logo, create_ticker_badge, get_logos_bulk
+from utils.news_utils import fetch_all_news, render_news_list, get_sentiment_emoji
 
 
 def render_decision_badge(decision: str):
@@ -156,6 +156,9 @@ def render(loader):
     st.markdown("---")
     st.markdown("### 📊 Latest Trading Decisions")
 
+    # Fetch any uncached logos in parallel before rendering the cards
+    get_logos_bulk([summary['ticker'] for summary in summaries])
+
     cols = st.columns(3)
 
     for idx, summary in enumerate(summaries):
@@ -336,8 +339,7 @@ def render(loader):
 
                             st.markdown("---")
 
-                            for article in filtered_articles[:15]:
-                                render_news_card(article, show_description=True)
+                            render_news_list(filtered_articles[:15], show_description=True)
                         else:
                             st.info("No news found matching the selected filter.")
                     else:
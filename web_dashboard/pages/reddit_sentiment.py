@@ -2,10 +2,13 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
 from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 import sys
 from pathlib import Path
 import json
@@ -33,6 +36,22 @@ def load_settings():
     return {}
 
 
+@st.cache_resource
+def get_reddit_client(client_id, client_secret, user_agent):
+    """Get a Reddit client shared across reruns for the given credentials"""
+    return RedditClient(
+        client_id=client_id,
+        client_secret=client_secret,
+        user_agent=user_agent
+    )
+
+
+@st.cache_resource
+def get_sentiment_analyzer(method):
+    """Get a sentiment analyzer shared across reruns for the given method"""
+    return SentimentAnalyzer(method=method)
+
+
 def create_sentiment_timeline_chart(posts):
     """Create sentiment timeline chart"""
     if not posts:
@@ -96,13 +115,11 @@ def create_sentiment_distribution_chart(posts):
     if not posts:
         return None
 
-    bullish = sum(1 for p in posts if p.get('sentiment', {}).get('label') == 'bullish')
-    neutral = sum(1 for p in posts if p.get('sentiment', {}).get('label') == 'neutral')
-    bearish = sum(1 for p in posts if p.get('sentiment', {}).get('label') == 'bearish')
+    label_counts = Counter(p.get('sentiment', {}).get('label') for p in posts)
 
     fig = go.Figure(data=[go.Pie(
         labels=['🟢 Bullish', '⚪ Neutral', '🔴 Bearish'],
-        values=[bullish, neutral, bearish],
+        values=[label_counts['bullish'], label_counts['neutral'], label_counts['bearish']],
         marker=dict(colors=['#10b981', '#6b7280', '#ef4444']),
         hole=0.3
     )])
@@ -121,13 +138,15 @@ def create_engagement_chart(posts):
     if not posts:
         return None
 
-    df = pd.DataFrame([{
-        'engagement': p.get('upvotes', 0) + p.get('num_comments', 0),
-        'sentiment': p.get('sentiment', {}).get('score', 0),
-        'title': p.get('title', '')[:50] + '...',
-        'upvotes': p.get('upvotes', 0),
-        'comments': p.get('num_comments', 0)
-    } for p in posts])
+    # Build columns directly so pandas skips per-row dict inference
+    count = len(posts)
+    df = pd.DataFrame({
+        'engagement': np.fromiter((p['engagement'] for p in posts), dtype=np.int64, count=count),
+        'sentiment': np.fromiter((p['sentiment']['score'] for p in posts), dtype=np.float64, count=count),
+        'title': [p.get('title', '')[:50] + '...' for p in posts],
+        'upvotes': [p.get('upvotes', 0) for p in posts],
+        'comments': [p.get('num_comments', 0) for p in posts]
+    })
 
     fig = px.scatter(
         df,
@@ -277,15 +296,15 @@ def render(loader):
         """)
         return
 
-    # Initialize clients
-    reddit_client = RedditClient(
-        client_id=reddit_client_id,
-        client_secret=reddit_client_secret,
-        user_agent=api_keys.get('reddit_user_agent', 'TradingAgents/1.0')
+    # Initialize clients (shared across reruns)
+    reddit_client = get_reddit_client(
+        reddit_client_id,
+        reddit_client_secret,
+        api_keys.get('reddit_user_agent', 'TradingAgents/1.0')
     )
 
-    sentiment_analyzer = SentimentAnalyzer(
-        method=reddit_settings.get('sentiment_method', 'vader')
+    sentiment_analyzer = get_sentiment_analyzer(
+        reddit_settings.get('sentiment_method', 'vader')
     )
 
     # Sidebar controls
@@ -533,9 +552,9 @@ def render(loader):
         with col2:
             # Most engaged posts
             st.markdown("**Most Engaged Posts:**")
-            top_engaged = sorted(posts, key=lambda x: x.get('upvotes', 0) + x.get('num_comments', 0), reverse=True)[:3]
+            top_engaged = nlargest(3, posts, key=itemgetter('engagement'))
             for i, post in enumerate(top_engaged, 1):
-                engagement = post.get('upvotes', 0) + post.get('num_comments', 0)
+                engagement = post['engagement']
                 sentiment = post.get('sentiment', {}).get('score', 0)
                 emoji = get_sentiment_emoji(sentiment)
                 st.markdown(f"{i}. {emoji} [{post.get('title', '')[:40]}...]({post.get('url', '#')}) - {engagement:,} engagement")
@@ -549,15 +568,19 @@ def render(loader):
             st.markdown("#### Sentiment Metrics")
             st.markdown(f"**Average Score**: {aggregate['avg_sentiment']:+.3f}")
             st.markdown(f"**Weighted Score**: {aggregate['weighted_sentiment']:+.3f}")
-            st.markdown(f"**Std Deviation**: {pd.Series([p['sentiment']['score'] for p in posts]).std():.3f}")
-            st.markdown(f"**Median Score**: {pd.Series([p['sentiment']['score'] for p in posts]).median():+.3f}")
+            scores = np.fromiter((p['sentiment']['score'] for p in posts), dtype=np.float64, count=len(posts))
+            std_score = scores.std(ddof=1) if scores.size > 1 else float('nan')
+            st.markdown(f"**Std Deviation**: {std_score:.3f}")
+            st.markdown(f"**Median Score**: {np.median(scores):+.3f}")
 
         with col2:
+            total_upvotes = sum(p.get('upvotes', 0) for p in posts)
+            total_comments = sum(p.get('num_comments', 0) for p in posts)
             st.markdown("#### Engagement Metrics")
-            st.markdown(f"**Total Upvotes**: {sum(p.get('upvotes', 0) for p in posts):,}")
-            st.markdown(f"**Total Comments**: {sum(p.get('num_comments', 0) for p in posts):,}")
-            st.markdown(f"**Avg Upvotes/Post**: {sum(p.get('upvotes', 0) for p in posts) / len(posts):.1f}")
-            st.markdown(f"**Avg Comments/Post**: {sum(p.get('num_comments', 0) for p in posts) / len(posts):.1f}")
+            st.markdown(f"**Total Upvotes**: {total_upvotes:,}")
+            st.markdown(f"**Total Comments**: {total_comments:,}")
+            st.markdown(f"**Avg Upvotes/Post**: {total_upvotes / len(posts):.1f}")
+            st.markdown(f"**Avg Comments/Post**: {total_comments / len(posts):.1f}")
 
         # Export data
         st.markdown("---")
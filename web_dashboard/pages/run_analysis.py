@@ -2,15 +2,11 @@
 
 import streamlit as st
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
-from dotenv import load_dotenv
 
-load_dotenv()
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from tradingagents.graph.trading_graph import TradingAgentsGraph
-from tradingagents.default_config import DEFAULT_CONFIG
+PROJECT_ROOT = str(Path(__file__).parent.parent.parent)
 
 
 LLM_PROVIDERS = {
@@ -83,13 +79,89 @@ DEEP_AGENT_OPTIONS = {
     }
 }
 
+# Dropdown option lists per provider, built once at import
+SHALLOW_OPTION_KEYS = {provider: list(options.keys()) for provider, options in SHALLOW_AGENT_OPTIONS.items()}
+DEEP_OPTION_KEYS = {provider: list(options.keys()) for provider, options in DEEP_AGENT_OPTIONS.items()}
+LLM_PROVIDER_NAMES = list(LLM_PROVIDERS.keys())
+
+# Top-level state keys and their labels in the "Reports Generated" summary
+REPORT_LABELS = (
+    ("market_report", "Market Analysis"),
+    ("sentiment_report", "Sentiment Analysis"),
+    ("news_report", "News Analysis"),
+    ("fundamentals_report", "Fundamentals Analysis"),
+    ("trader_investment_plan", "Trading Plan"),
+)
+
+# Pipeline stages as (name, start %, end %) progress bounds
+TEAM_STAGES = (
+    ("Analyst Team", 30, 50),
+    ("Research Team", 50, 70),
+    ("Trading Team", 70, 85),
+    ("Risk Management Team", 85, 95),
+)
+
+# State keys whose (non-empty) value marks each team's output. The graph streams
+# full state values, so every key is present in every chunk from the start.
+STAGE_KEYS = {
+    "Analyst Team": ("market_report", "sentiment_report", "news_report", "fundamentals_report"),
+    "Research Team": ("investment_plan",),
+    "Trading Team": ("trader_investment_plan",),
+    "Risk Management Team": ("final_trade_decision",),
+}
+
+# Top-level report sections that are final as soon as they appear in the stream
+STREAMED_REPORT_SECTIONS = frozenset({
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+    "trader_investment_plan",
+})
+
+
+def ensure_project_path():
+    """Make the tradingagents package importable, inserting the project root once"""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+
+
+@st.cache_resource(show_spinner=False)
+def get_trading_graph(analysts, config_items):
+    """Get a trading graph shared across runs with the same analysts and config
+
+    Args:
+        analysts: Tuple of selected analysts, in execution order
+        config_items: Sorted tuple of config (key, value) pairs
+    """
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    return TradingAgentsGraph(
+        selected_analysts=list(analysts),
+        config=dict(config_items),
+        debug=False
+    )
+
+
+def get_report_dir(ticker, analysis_date, config):
+    """Return the reports directory for an analysis without creating it"""
+    return Path(config["results_dir"]) / ticker / analysis_date / "reports"
 
-def save_reports(final_state, ticker, analysis_date, config):
-    """Save analysis reports to files"""
-    results_dir = Path(config["results_dir"]) / ticker / analysis_date
-    results_dir.mkdir(parents=True, exist_ok=True)
-    report_dir = results_dir / "reports"
+
+def write_report(report_dir, section_name, content):
+    """Write one report section, creating the reports directory on first use
+
+    The directory is only created once there is something to put in it, so a
+    run that fails early does not leave an empty dated folder behind that the
+    report loader would list as the latest analysis.
+    """
     report_dir.mkdir(parents=True, exist_ok=True)
+    (report_dir / f"{section_name}.md").write_text(content, encoding="utf-8")
+
+
+def save_reports(final_state, ticker, analysis_date, config, skip=()):
+    """Save analysis reports to files, skipping sections already written"""
+    report_dir = get_report_dir(ticker, analysis_date, config)
 
     report_sections = {
         "market_report": final_state.get("market_report"),
@@ -102,10 +174,8 @@ def save_reports(final_state, ticker, analysis_date, config):
     }
 
     for section_name, content in report_sections.items():
-        if content:
-            file_name = f"{section_name}.md"
-            with open(report_dir / file_name, "w") as f:
-                f.write(content)
+        if content and section_name not in skip:
+            write_report(report_dir, section_name, content)
 
 
 def render(loader):
@@ -116,19 +186,22 @@ def render(loader):
 
     st.markdown("---")
 
-    with st.form("analysis_form"):
+    with st.form("analysis_form", clear_on_submit=False):
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown("#### 📊 Analysis Parameters")
 
-            ticker = st.text_input(
+            ticker_raw = st.text_input(
                 "Ticker Symbol",
                 value="SPY",
                 help="Enter the stock ticker symbol to analyze"
-            ).upper()
+            )
 
-            today = datetime.date.today()
+            # Pinned once per session so the date bounds stay stable across reruns
+            if 'run_analysis_today' not in st.session_state:
+                st.session_state.run_analysis_today = datetime.date.today()
+            today = st.session_state.run_analysis_today
             analysis_date = st.date_input(
                 "Analysis Date",
                 value=today,
@@ -160,14 +233,14 @@ def render(loader):
 
             llm_provider = st.selectbox(
                 "LLM Provider",
-                list(LLM_PROVIDERS.keys()),
+                LLM_PROVIDER_NAMES,
                 index=0,
                 help="Select the LLM provider to use"
             )
 
             provider_key = llm_provider.lower()
 
-            shallow_options = list(SHALLOW_AGENT_OPTIONS.get(provider_key, {}).keys())
+            shallow_options = SHALLOW_OPTION_KEYS.get(provider_key, [])
             shallow_thinker = st.selectbox(
                 "Quick-Thinking Model",
                 shallow_options,
@@ -175,7 +248,7 @@ def render(loader):
                 help="Model for fast, routine tasks"
             )
 
-            deep_options = list(DEEP_AGENT_OPTIONS.get(provider_key, {}).keys())
+            deep_options = DEEP_OPTION_KEYS.get(provider_key, [])
             deep_thinker = st.selectbox(
                 "Deep-Thinking Model",
                 deep_options,
@@ -192,6 +265,7 @@ def render(loader):
         )
 
     if submitted:
+        ticker = ticker_raw.strip().upper()
         if not ticker:
             st.error("Please enter a ticker symbol")
             return
@@ -204,6 +278,14 @@ def render(loader):
             st.error("Please select both thinking models")
             return
 
+        # Deferred until submission so browsing the form skips the .env lookup and
+        # the tradingagents import chain. DEFAULT_CONFIG reads env vars on import.
+        from dotenv import load_dotenv
+        load_dotenv()
+        ensure_project_path()
+        from tradingagents.default_config import DEFAULT_CONFIG
+        from tradingagents.dataflows.config import set_config
+
         shallow_model = SHALLOW_AGENT_OPTIONS.get(provider_key, {}).get(shallow_thinker)
         deep_model = DEEP_AGENT_OPTIONS.get(provider_key, {}).get(deep_thinker)
 
@@ -223,84 +305,61 @@ def render(loader):
         progress_container = st.container()
 
         with progress_container:
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-
-            status_text.text("Initializing trading agents...")
-            progress_bar.progress(10)
+            # Value and label travel in one element update per stage
+            progress_bar = st.progress(10, text="Initializing trading agents...")
 
             try:
-                graph = TradingAgentsGraph(
-                    selected_analysts=analysts,
-                    config=config,
-                    debug=False
-                )
+                graph = get_trading_graph(tuple(analysts), tuple(sorted(config.items())))
+                # A cached graph skips __init__, so re-apply its config to the dataflows
+                set_config(graph.config)
 
-                status_text.text(f"Running analysis for {ticker}...")
-                progress_bar.progress(30)
+                progress_bar.progress(30, text=f"Running analysis for {ticker}...")
 
                 init_agent_state = graph.propagator.create_initial_state(
                     ticker, analysis_date_str
                 )
                 args = graph.propagator.get_graph_args()
 
-                team_stages = [
-                    ("Analyst Team", 30, 50),
-                    ("Research Team", 50, 70),
-                    ("Trading Team", 70, 85),
-                    ("Risk Management Team", 85, 95),
-                ]
-
                 current_stage = 0
-                trace = []
-
-                for chunk in graph.graph.stream(init_agent_state, **args):
-                    if len(chunk.get("messages", [])) > 0:
-                        trace.append(chunk)
-
-                        if "market_report" in chunk or "sentiment_report" in chunk or "news_report" in chunk or "fundamentals_report" in chunk:
-                            if current_stage < len(team_stages):
-                                stage_name, start, end = team_stages[current_stage]
-                                status_text.text(f"Processing {stage_name}...")
-                                progress_bar.progress(end)
-                                current_stage += 1
-
-                        elif "investment_debate_state" in chunk:
-                            if current_stage < len(team_stages) and team_stages[current_stage][0] == "Research Team":
-                                stage_name, start, end = team_stages[current_stage]
-                                status_text.text(f"Processing {stage_name}...")
-                                progress_bar.progress(end)
-                                current_stage += 1
-
-                        elif "trader_investment_plan" in chunk:
-                            if current_stage < len(team_stages) and team_stages[current_stage][0] == "Trading Team":
-                                stage_name, start, end = team_stages[current_stage]
-                                status_text.text(f"Processing {stage_name}...")
-                                progress_bar.progress(end)
-                                current_stage += 1
-
-                        elif "risk_debate_state" in chunk:
-                            if current_stage < len(team_stages) and team_stages[current_stage][0] == "Risk Management Team":
-                                stage_name, start, end = team_stages[current_stage]
-                                status_text.text(f"Processing {stage_name}...")
-                                progress_bar.progress(end)
-                                current_stage += 1
-
-                if not trace:
+                final_state = None
+                report_dir = get_report_dir(ticker, analysis_date_str, config)
+                unwritten_sections = set(STREAMED_REPORT_SECTIONS)
+                pending_writes = []
+
+                with ThreadPoolExecutor(max_workers=2) as writer:
+                    for chunk in graph.graph.stream(init_agent_state, **args):
+                        if len(chunk.get("messages", [])) > 0:
+                            final_state = chunk
+
+                            # Write finished sections in the background while the LLMs keep working
+                            ready_sections = [name for name in unwritten_sections if chunk.get(name)]
+                            for section_name in ready_sections:
+                                unwritten_sections.discard(section_name)
+                                pending_writes.append(writer.submit(
+                                    write_report, report_dir, section_name, chunk[section_name]
+                                ))
+
+                            if current_stage < len(TEAM_STAGES):
+                                stage_name, start, end = TEAM_STAGES[current_stage]
+                                if any(chunk.get(key) for key in STAGE_KEYS[stage_name]):
+                                    progress_bar.progress(end, text=f"Processing {stage_name}...")
+                                    current_stage += 1
+
+                # Surface any background write errors
+                for future in pending_writes:
+                    future.result()
+
+                if final_state is None:
                     st.error("Analysis completed but no results were generated")
                     return
 
-                final_state = trace[-1]
-
-                status_text.text("Saving reports...")
-                progress_bar.progress(95)
+                progress_bar.progress(95, text="Saving reports...")
 
-                save_reports(final_state, ticker, analysis_date_str, config)
+                save_reports(final_state, ticker, analysis_date_str, config, skip=STREAMED_REPORT_SECTIONS - unwritten_sections)
 
                 decision = graph.process_signal(final_state.get("final_trade_decision", ""))
 
-                progress_bar.progress(100)
-                status_text.text("Analysis completed successfully!")
+                progress_bar.progress(100, text="Analysis completed successfully!")
 
                 st.success(f"✅ Analysis completed for {ticker}!")
 
@@ -320,17 +379,7 @@ def render(loader):
                 st.markdown("---")
                 st.markdown("### 📊 Reports Generated")
 
-                reports_generated = []
-                if final_state.get("market_report"):
-                    reports_generated.append("Market Analysis")
-                if final_state.get("sentiment_report"):
-                    reports_generated.append("Sentiment Analysis")
-                if final_state.get("news_report"):
-                    reports_generated.append("News Analysis")
-                if final_state.get("fundamentals_report"):
-                    reports_generated.append("Fundamentals Analysis")
-                if final_state.get("trader_investment_plan"):
-                    reports_generated.append("Trading Plan")
+                reports_generated = [label for key, label in REPORT_LABELS if final_state.get(key)]
                 if final_state.get("risk_debate_state", {}).get("judge_decision"):
                     reports_generated.append("Final Decision")
 
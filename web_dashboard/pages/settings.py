@@ -2,11 +2,17 @@
 
 import streamlit as st
 import json
+import copy
+import os
 from pathlib import Path
 
+# Upper bound for imported settings files; real settings are a few KB
+MAX_SETTINGS_FILE_SIZE = 64 * 1024
 
+
+@st.cache_data(ttl=60, show_spinner=False)
 def load_settings():
-    """Load settings from file"""
+    """Load settings from file (cached; cleared by save_settings)"""
     settings_file = Path(__file__).parent.parent / "settings.json"
 
     default_settings = {
@@ -38,383 +44,458 @@ def load_settings():
 def save_settings(settings: dict):
     """Save settings to file"""
     settings_file = Path(__file__).parent.parent / "settings.json"
+    tmp_file = settings_file.with_suffix('.json.tmp')
 
     try:
-        with open(settings_file, 'w') as f:
+        # Write to a temp file and rename over the original so a crash mid-write
+        # never leaves a truncated settings.json behind
+        with open(tmp_file, 'w') as f:
             json.dump(settings, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, settings_file)
+        load_settings.clear()
         return True
     except Exception:
+        tmp_file.unlink(missing_ok=True)
         return False
 
 
-def render(loader):
-    """Render the settings page"""
+@st.cache_data(max_entries=4, show_spinner=False)
+def settings_to_json(settings: dict) -> str:
+    """Serialize settings for export (cached on the settings contents)"""
+    return json.dumps(settings, indent=2)
 
-    st.markdown('<p class="main-header">Dashboard Settings</p>', unsafe_allow_html=True)
-    st.markdown("### Configure your dashboard preferences")
 
-    if 'settings' not in st.session_state:
-        st.session_state.settings = load_settings()
+def render_display_settings(settings: dict):
+    """Render the Display settings tab"""
 
-    settings = st.session_state.settings
+    st.subheader("Display Settings")
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["🎨 Display", "📊 Data", "🔔 Notifications", "🔑 API Keys", "🤖 Reddit"])
+    col1, col2 = st.columns(2)
 
-    with tab1:
-        st.subheader("Display Settings")
+    with col1:
+        theme = st.selectbox(
+            "Theme",
+            ["light", "dark"],
+            index=0 if settings.get('theme', 'light') == 'light' else 1
+        )
+        settings['theme'] = theme
+
+        max_tickers = st.number_input(
+            "Max Tickers on Dashboard",
+            min_value=5,
+            max_value=50,
+            value=settings.get('max_tickers_display', 10),
+            step=5
+        )
+        settings['max_tickers_display'] = int(max_tickers)
 
-        col1, col2 = st.columns(2)
+    with col2:
+        refresh_interval = st.number_input(
+            "Auto-Refresh Interval (seconds)",
+            min_value=30,
+            max_value=300,
+            value=settings.get('refresh_interval', 60),
+            step=30,
+            help="How often to refresh real-time data"
+        )
+        settings['refresh_interval'] = int(refresh_interval)
 
-        with col1:
-            theme = st.selectbox(
-                "Theme",
-                ["light", "dark"],
-                index=0 if settings.get('theme', 'light') == 'light' else 1
-            )
-            settings['theme'] = theme
-
-            max_tickers = st.number_input(
-                "Max Tickers on Dashboard",
-                min_value=5,
-                max_value=50,
-                value=settings.get('max_tickers_display', 10),
-                step=5
-            )
-            settings['max_tickers_display'] = int(max_tickers)
+    st.markdown("---")
+    st.subheader("Widget Visibility")
 
-        with col2:
-            refresh_interval = st.number_input(
-                "Auto-Refresh Interval (seconds)",
-                min_value=30,
-                max_value=300,
-                value=settings.get('refresh_interval', 60),
-                step=30,
-                help="How often to refresh real-time data"
-            )
-            settings['refresh_interval'] = int(refresh_interval)
+    col1, col2 = st.columns(2)
 
-        st.markdown("---")
-        st.subheader("Widget Visibility")
+    with col1:
+        show_news = st.checkbox(
+            "Show News Section",
+            value=settings.get('show_news', True)
+        )
+        settings['show_news'] = show_news
+
+    with col2:
+        show_technical = st.checkbox(
+            "Show Technical Indicators",
+            value=settings.get('show_technical_indicators', True)
+        )
+        settings['show_technical_indicators'] = show_technical
+
+    st.markdown("---")
+    st.subheader("Color Scheme")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        buy_color = st.color_picker(
+            "BUY Color",
+            value=settings.get('colors', {}).get('buy', '#10b981')
+        )
+
+    with col2:
+        hold_color = st.color_picker(
+            "HOLD Color",
+            value=settings.get('colors', {}).get('hold', '#f59e0b')
+        )
+
+    with col3:
+        sell_color = st.color_picker(
+            "SELL Color",
+            value=settings.get('colors', {}).get('sell', '#ef4444')
+        )
+
+    if 'colors' not in settings:
+        settings['colors'] = {}
+
+    settings['colors']['buy'] = buy_color
+    settings['colors']['hold'] = hold_color
+    settings['colors']['sell'] = sell_color
+
+
+def render_data_settings(settings: dict):
+    """Render the Data settings tab"""
+
+    st.subheader("Data Settings")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        default_currency = st.selectbox(
+            "Default Currency",
+            ["USD", "EUR", "GBP", "BRL"],
+            index=["USD", "EUR", "GBP", "BRL"].index(settings.get('default_currency', 'USD'))
+        )
+        settings['default_currency'] = default_currency
+
+        default_period = st.selectbox(
+            "Default Time Period",
+            ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y"],
+            index=["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y"].index(settings.get('default_period', '1mo'))
+        )
+        settings['default_period'] = default_period
+
+    with col2:
+        data_source = st.selectbox(
+            "Price Data Source",
+            ["Yahoo Finance", "Alpha Vantage"],
+            index=0
+        )
+        settings['data_source'] = data_source
+
+        cache_duration = st.number_input(
+            "Cache Duration (minutes)",
+            min_value=5,
+            max_value=60,
+            value=settings.get('cache_duration', 15),
+            step=5,
+            help="How long to cache API responses"
+        )
+        settings['cache_duration'] = int(cache_duration)
+
+    st.markdown("---")
+    st.subheader("Export Settings")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        export_format = st.selectbox(
+            "Default Export Format",
+            ["CSV", "JSON", "Excel"],
+            index=0
+        )
+        settings['export_format'] = export_format
+
+    with col2:
+        include_metadata = st.checkbox(
+            "Include Metadata in Exports",
+            value=settings.get('include_metadata', True)
+        )
+        settings['include_metadata'] = include_metadata
+
+
+def render_notification_settings(settings: dict):
+    """Render the Notifications settings tab"""
+
+    st.subheader("Notification Settings")
+
+    enable_notifications = st.checkbox(
+        "Enable Notifications",
+        value=settings.get('enable_notifications', False)
+    )
+    settings['enable_notifications'] = enable_notifications
+
+    if enable_notifications:
+        st.info("💡 Notifications are enabled. Configure alert thresholds below.")
 
         col1, col2 = st.columns(2)
 
         with col1:
-            show_news = st.checkbox(
-                "Show News Section",
-                value=settings.get('show_news', True)
+            price_change_threshold = st.number_input(
+                "Price Change Alert (%)",
+                min_value=1.0,
+                max_value=50.0,
+                value=settings.get('price_change_threshold', 5.0),
+                step=0.5,
+                help="Alert when price changes by this percentage"
             )
-            settings['show_news'] = show_news
+            settings['price_change_threshold'] = price_change_threshold
 
         with col2:
-            show_technical = st.checkbox(
-                "Show Technical Indicators",
-                value=settings.get('show_technical_indicators', True)
+            volume_spike_threshold = st.number_input(
+                "Volume Spike Alert (x)",
+                min_value=1.0,
+                max_value=10.0,
+                value=settings.get('volume_spike_threshold', 2.0),
+                step=0.5,
+                help="Alert when volume exceeds average by this multiple"
             )
-            settings['show_technical_indicators'] = show_technical
+            settings['volume_spike_threshold'] = volume_spike_threshold
 
         st.markdown("---")
-        st.subheader("Color Scheme")
+        st.subheader("Notification Methods")
 
-        col1, col2, col3 = st.columns(3)
+        notification_email = st.text_input(
+            "Email Address",
+            value=settings.get('notification_email', ''),
+            help="Receive alerts via email"
+        )
+        settings['notification_email'] = notification_email
 
-        with col1:
-            buy_color = st.color_picker(
-                "BUY Color",
-                value=settings.get('colors', {}).get('buy', '#10b981')
-            )
+        notification_webhook = st.text_input(
+            "Webhook URL",
+            value=settings.get('notification_webhook', ''),
+            help="Send alerts to a webhook (e.g., Slack, Discord)"
+        )
+        settings['notification_webhook'] = notification_webhook
+    else:
+        st.info("Notifications are currently disabled.")
+
+
+def render_api_key_settings(settings: dict):
+    """Render the API Keys settings tab"""
+
+    st.subheader("API Keys")
+
+    st.markdown("Configure API keys for external data sources.")
+
+    st.markdown("#### Alpha Vantage")
+    alpha_vantage_key = st.text_input(
+        "API Key",
+        value=settings.get('api_keys', {}).get('alpha_vantage', ''),
+        type="password",
+        help="Get a free key at https://www.alphavantage.co/support/#api-key"
+    )
+
+    if 'api_keys' not in settings:
+        settings['api_keys'] = {}
+
+    settings['api_keys']['alpha_vantage'] = alpha_vantage_key
+
+    st.markdown("#### News API")
+    news_api_key = st.text_input(
+        "API Key",
+        value=settings.get('api_keys', {}).get('news_api', ''),
+        type="password",
+        help="Get a free key at https://newsapi.org/"
+    )
+
+    settings['api_keys']['news_api'] = news_api_key
+
+    st.markdown("#### Reddit API")
+    st.markdown("Get credentials at: https://www.reddit.com/prefs/apps")
+
+    reddit_client_id = st.text_input(
+        "Client ID",
+        value=settings.get('api_keys', {}).get('reddit_client_id', ''),
+        type="password",
+        help="Your Reddit app client ID"
+    )
+    settings['api_keys']['reddit_client_id'] = reddit_client_id
+
+    reddit_client_secret = st.text_input(
+        "Client Secret",
+        value=settings.get('api_keys', {}).get('reddit_client_secret', ''),
+        type="password",
+        help="Your Reddit app client secret"
+    )
+    settings['api_keys']['reddit_client_secret'] = reddit_client_secret
+
+    reddit_user_agent = st.text_input(
+        "User Agent",
+        value=settings.get('api_keys', {}).get('reddit_user_agent', 'TradingAgents/1.0'),
+        help="User agent string for Reddit API"
+    )
+    settings['api_keys']['reddit_user_agent'] = reddit_user_agent
 
-        with col2:
-            hold_color = st.color_picker(
-                "HOLD Color",
-                value=settings.get('colors', {}).get('hold', '#f59e0b')
-            )
+    st.markdown("---")
+    st.warning("⚠️ Keep your API keys secure. Never share them publicly.")
 
-        with col3:
-            sell_color = st.color_picker(
-                "SELL Color",
-                value=settings.get('colors', {}).get('sell', '#ef4444')
-            )
 
-        if 'colors' not in settings:
-            settings['colors'] = {}
+def render_reddit_settings(settings: dict):
+    """Render the Reddit settings tab"""
 
-        settings['colors']['buy'] = buy_color
-        settings['colors']['hold'] = hold_color
-        settings['colors']['sell'] = sell_color
+    st.subheader("Reddit Sentiment Settings")
 
-    with tab2:
-        st.subheader("Data Settings")
+    reddit_enabled = st.checkbox(
+        "Enable Reddit Sentiment Analysis",
+        value=settings.get('reddit', {}).get('enabled', True),
+        help="Enable real-time sentiment analysis from Reddit"
+    )
 
-        col1, col2 = st.columns(2)
+    if 'reddit' not in settings:
+        settings['reddit'] = {}
 
-        with col1:
-            default_currency = st.selectbox(
-                "Default Currency",
-                ["USD", "EUR", "GBP", "BRL"],
-                index=["USD", "EUR", "GBP", "BRL"].index(settings.get('default_currency', 'USD'))
-            )
-            settings['default_currency'] = default_currency
+    settings['reddit']['enabled'] = reddit_enabled
 
-            default_period = st.selectbox(
-                "Default Time Period",
-                ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y"],
-                index=["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y"].index(settings.get('default_period', '1mo'))
-            )
-            settings['default_period'] = default_period
+    if reddit_enabled:
+        st.markdown("#### Subreddits")
+        st.markdown("Select which subreddits to monitor for sentiment analysis")
 
-        with col2:
-            data_source = st.selectbox(
-                "Price Data Source",
-                ["Yahoo Finance", "Alpha Vantage"],
-                index=0
-            )
-            settings['data_source'] = data_source
+        available_subs = {
+            'wallstreetbets': 'r/wallstreetbets (15M members)',
+            'stocks': 'r/stocks (6M members)',
+            'investing': 'r/investing (2M members)',
+            'StockMarket': 'r/StockMarket (2M members)',
+            'options': 'r/options (400K members)',
+            'pennystocks': 'r/pennystocks (300K members)'
+        }
 
-            cache_duration = st.number_input(
-                "Cache Duration (minutes)",
-                min_value=5,
-                max_value=60,
-                value=settings.get('cache_duration', 15),
-                step=5,
-                help="How long to cache API responses"
-            )
-            settings['cache_duration'] = int(cache_duration)
+        current_subs = settings.get('reddit', {}).get('subreddits', ['wallstreetbets', 'stocks', 'investing'])
+        selected_subs_display = [f"{sub} ({available_subs[sub]})" for sub in current_subs if sub in available_subs]
 
-        st.markdown("---")
-        st.subheader("Export Settings")
+        selected_subs = st.multiselect(
+            "Active Subreddits",
+            [f"{k} ({v})" for k, v in available_subs.items()],
+            default=selected_subs_display
+        )
+
+        settings['reddit']['subreddits'] = [s.split(' ')[0] for s in selected_subs]
+
+        st.markdown("#### Analysis Settings")
 
         col1, col2 = st.columns(2)
 
         with col1:
-            export_format = st.selectbox(
-                "Default Export Format",
-                ["CSV", "JSON", "Excel"],
-                index=0
+            posts_per_sub = st.slider(
+                "Posts per Subreddit",
+                min_value=10,
+                max_value=100,
+                value=settings.get('reddit', {}).get('posts_per_subreddit', 50),
+                step=10,
+                help="Number of posts to fetch per subreddit"
             )
-            settings['export_format'] = export_format
+            settings['reddit']['posts_per_subreddit'] = int(posts_per_sub)
 
-        with col2:
-            include_metadata = st.checkbox(
-                "Include Metadata in Exports",
-                value=settings.get('include_metadata', True)
+            time_filter = st.selectbox(
+                "Default Time Filter",
+                ["hour", "day", "week", "month"],
+                index=["hour", "day", "week", "month"].index(settings.get('reddit', {}).get('time_filter', 'day'))
             )
-            settings['include_metadata'] = include_metadata
+            settings['reddit']['time_filter'] = time_filter
 
-    with tab3:
-        st.subheader("Notification Settings")
-
-        enable_notifications = st.checkbox(
-            "Enable Notifications",
-            value=settings.get('enable_notifications', False)
-        )
-        settings['enable_notifications'] = enable_notifications
-
-        if enable_notifications:
-            st.info("💡 Notifications are enabled. Configure alert thresholds below.")
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                price_change_threshold = st.number_input(
-                    "Price Change Alert (%)",
-                    min_value=1.0,
-                    max_value=50.0,
-                    value=settings.get('price_change_threshold', 5.0),
-                    step=0.5,
-                    help="Alert when price changes by this percentage"
-                )
-                settings['price_change_threshold'] = price_change_threshold
-
-            with col2:
-                volume_spike_threshold = st.number_input(
-                    "Volume Spike Alert (x)",
-                    min_value=1.0,
-                    max_value=10.0,
-                    value=settings.get('volume_spike_threshold', 2.0),
-                    step=0.5,
-                    help="Alert when volume exceeds average by this multiple"
-                )
-                settings['volume_spike_threshold'] = volume_spike_threshold
-
-            st.markdown("---")
-            st.subheader("Notification Methods")
-
-            notification_email = st.text_input(
-                "Email Address",
-                value=settings.get('notification_email', ''),
-                help="Receive alerts via email"
+        with col2:
+            cache_ttl = st.number_input(
+                "Cache Duration (seconds)",
+                min_value=300,
+                max_value=3600,
+                value=settings.get('reddit', {}).get('cache_ttl', 900),
+                step=300,
+                help="How long to cache Reddit data"
             )
-            settings['notification_email'] = notification_email
+            settings['reddit']['cache_ttl'] = int(cache_ttl)
 
-            notification_webhook = st.text_input(
-                "Webhook URL",
-                value=settings.get('notification_webhook', ''),
-                help="Send alerts to a webhook (e.g., Slack, Discord)"
+            min_upvotes = st.number_input(
+                "Minimum Upvotes",
+                min_value=0,
+                max_value=100,
+                value=settings.get('reddit', {}).get('min_upvotes', 10),
+                step=5,
+                help="Filter posts with fewer upvotes"
             )
-            settings['notification_webhook'] = notification_webhook
-        else:
-            st.info("Notifications are currently disabled.")
+            settings['reddit']['min_upvotes'] = int(min_upvotes)
 
-    with tab4:
-        st.subheader("API Keys")
+        st.markdown("#### Sentiment Engine")
 
-        st.markdown("Configure API keys for external data sources.")
+        sentiment_method = st.selectbox(
+            "Sentiment Analysis Method",
+            ["vader", "textblob", "hybrid"],
+            index=["vader", "textblob", "hybrid"].index(settings.get('reddit', {}).get('sentiment_method', 'vader')),
+            help="VADER is optimized for social media text"
+        )
+        settings['reddit']['sentiment_method'] = sentiment_method
 
-        st.markdown("#### Alpha Vantage")
-        alpha_vantage_key = st.text_input(
-            "API Key",
-            value=settings.get('api_keys', {}).get('alpha_vantage', ''),
-            type="password",
-            help="Get a free key at https://www.alphavantage.co/support/#api-key"
+        show_trending = st.checkbox(
+            "Show Trending Tickers",
+            value=settings.get('reddit', {}).get('show_trending', True),
+            help="Display trending tickers on Reddit"
         )
+        settings['reddit']['show_trending'] = show_trending
 
-        if 'api_keys' not in settings:
-            settings['api_keys'] = {}
+        st.markdown("---")
+        st.info("💡 Sentiment analysis uses natural language processing to gauge market mood from Reddit discussions.")
 
-        settings['api_keys']['alpha_vantage'] = alpha_vantage_key
+    else:
+        st.info("Reddit sentiment analysis is currently disabled. Enable it to start analyzing social media sentiment.")
 
-        st.markdown("#### News API")
-        news_api_key = st.text_input(
-            "API Key",
-            value=settings.get('api_keys', {}).get('news_api', ''),
-            type="password",
-            help="Get a free key at https://newsapi.org/"
-        )
 
-        settings['api_keys']['news_api'] = news_api_key
+@st.cache_data(ttl=60, show_spinner=False)
+def count_total_analyses(tickers: tuple, _loader) -> int:
+    """Count analyses across tickers (cached; loader is not hashed)"""
+    return sum(_loader.get_ticker_summary(ticker)['total_analyses'] for ticker in tickers)
 
-        st.markdown("#### Reddit API")
-        st.markdown("Get credentials at: https://www.reddit.com/prefs/apps")
 
-        reddit_client_id = st.text_input(
-            "Client ID",
-            value=settings.get('api_keys', {}).get('reddit_client_id', ''),
-            type="password",
-            help="Your Reddit app client ID"
-        )
-        settings['api_keys']['reddit_client_id'] = reddit_client_id
+@st.fragment
+def render_dashboard_info(loader):
+    """Render the dashboard information block"""
 
-        reddit_client_secret = st.text_input(
-            "Client Secret",
-            value=settings.get('api_keys', {}).get('reddit_client_secret', ''),
-            type="password",
-            help="Your Reddit app client secret"
-        )
-        settings['api_keys']['reddit_client_secret'] = reddit_client_secret
+    st.subheader("Dashboard Information")
 
-        reddit_user_agent = st.text_input(
-            "User Agent",
-            value=settings.get('api_keys', {}).get('reddit_user_agent', 'TradingAgents/1.0'),
-            help="User agent string for Reddit API"
-        )
-        settings['api_keys']['reddit_user_agent'] = reddit_user_agent
+    col1, col2, col3 = st.columns(3)
 
-        st.markdown("---")
-        st.warning("⚠️ Keep your API keys secure. Never share them publicly.")
+    with col1:
+        tickers = loader.get_available_tickers()
+        st.metric("Total Tickers", len(tickers))
 
-    with tab5:
-        st.subheader("Reddit Sentiment Settings")
+    with col2:
+        st.metric("Total Analyses", count_total_analyses(tuple(tickers), loader))
 
-        reddit_enabled = st.checkbox(
-            "Enable Reddit Sentiment Analysis",
-            value=settings.get('reddit', {}).get('enabled', True),
-            help="Enable real-time sentiment analysis from Reddit"
-        )
+    with col3:
+        settings_file = Path(__file__).parent.parent / "settings.json"
+        if settings_file.exists():
+            st.metric("Settings File", "✅ Exists")
+        else:
+            st.metric("Settings File", "❌ Not Found")
 
-        if 'reddit' not in settings:
-            settings['reddit'] = {}
 
-        settings['reddit']['enabled'] = reddit_enabled
+def render(loader):
+    """Render the settings page"""
 
-        if reddit_enabled:
-            st.markdown("#### Subreddits")
-            st.markdown("Select which subreddits to monitor for sentiment analysis")
+    st.markdown('<p class="main-header">Dashboard Settings</p>', unsafe_allow_html=True)
+    st.markdown("### Configure your dashboard preferences")
 
-            available_subs = {
-                'wallstreetbets': 'r/wallstreetbets (15M members)',
-                'stocks': 'r/stocks (6M members)',
-                'investing': 'r/investing (2M members)',
-                'StockMarket': 'r/StockMarket (2M members)',
-                'options': 'r/options (400K members)',
-                'pennystocks': 'r/pennystocks (300K members)'
-            }
+    # Explicit check rather than setdefault so load_settings() only runs when needed
+    if 'settings' not in st.session_state:
+        st.session_state.settings = load_settings()
+        st.session_state.settings_snapshot = copy.deepcopy(st.session_state.settings)
 
-            current_subs = settings.get('reddit', {}).get('subreddits', ['wallstreetbets', 'stocks', 'investing'])
-            selected_subs_display = [f"{sub} ({available_subs[sub]})" for sub in current_subs if sub in available_subs]
+    settings = st.session_state.settings
 
-            selected_subs = st.multiselect(
-                "Active Subreddits",
-                [f"{k} ({v})" for k, v in available_subs.items()],
-                default=selected_subs_display
-            )
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["🎨 Display", "📊 Data", "🔔 Notifications", "🔑 API Keys", "🤖 Reddit"])
 
-            settings['reddit']['subreddits'] = [s.split(' ')[0] for s in selected_subs]
-
-            st.markdown("#### Analysis Settings")
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                posts_per_sub = st.slider(
-                    "Posts per Subreddit",
-                    min_value=10,
-                    max_value=100,
-                    value=settings.get('reddit', {}).get('posts_per_subreddit', 50),
-                    step=10,
-                    help="Number of posts to fetch per subreddit"
-                )
-                settings['reddit']['posts_per_subreddit'] = int(posts_per_sub)
-
-                time_filter = st.selectbox(
-                    "Default Time Filter",
-                    ["hour", "day", "week", "month"],
-                    index=["hour", "day", "week", "month"].index(settings.get('reddit', {}).get('time_filter', 'day'))
-                )
-                settings['reddit']['time_filter'] = time_filter
-
-            with col2:
-                cache_ttl = st.number_input(
-                    "Cache Duration (seconds)",
-                    min_value=300,
-                    max_value=3600,
-                    value=settings.get('reddit', {}).get('cache_ttl', 900),
-                    step=300,
-                    help="How long to cache Reddit data"
-                )
-                settings['reddit']['cache_ttl'] = int(cache_ttl)
-
-                min_upvotes = st.number_input(
-                    "Minimum Upvotes",
-                    min_value=0,
-                    max_value=100,
-                    value=settings.get('reddit', {}).get('min_upvotes', 10),
-                    step=5,
-                    help="Filter posts with fewer upvotes"
-                )
-                settings['reddit']['min_upvotes'] = int(min_upvotes)
-
-            st.markdown("#### Sentiment Engine")
-
-            sentiment_method = st.selectbox(
-                "Sentiment Analysis Method",
-                ["vader", "textblob", "hybrid"],
-                index=["vader", "textblob", "hybrid"].index(settings.get('reddit', {}).get('sentiment_method', 'vader')),
-                help="VADER is optimized for social media text"
-            )
-            settings['reddit']['sentiment_method'] = sentiment_method
+    with tab1:
+        render_display_settings(settings)
 
-            show_trending = st.checkbox(
-                "Show Trending Tickers",
-                value=settings.get('reddit', {}).get('show_trending', True),
-                help="Display trending tickers on Reddit"
-            )
-            settings['reddit']['show_trending'] = show_trending
+    with tab2:
+        render_data_settings(settings)
 
-            st.markdown("---")
-            st.info("💡 Sentiment analysis uses natural language processing to gauge market mood from Reddit discussions.")
+    with tab3:
+        render_notification_settings(settings)
 
-        else:
-            st.info("Reddit sentiment analysis is currently disabled. Enable it to start analyzing social media sentiment.")
+    with tab4:
+        render_api_key_settings(settings)
+
+    with tab5:
+        render_reddit_settings(settings)
 
     st.markdown("---")
 
@@ -425,39 +506,26 @@ def render(loader):
 
     with col2:
         if st.button("Reset to Defaults", type="secondary"):
+            load_settings.clear()
             st.session_state.settings = load_settings()
+            st.session_state.settings_snapshot = copy.deepcopy(st.session_state.settings)
             st.success("Settings reset to defaults")
             st.rerun()
 
     with col3:
         if st.button("Save Settings", type="primary"):
-            if save_settings(settings):
+            # Only rewrite the file when something changed (or it doesn't exist yet)
+            settings_file = Path(__file__).parent.parent / "settings.json"
+            if settings == st.session_state.get('settings_snapshot') and settings_file.exists():
+                st.info("No changes to save")
+            elif save_settings(settings):
+                st.session_state.settings_snapshot = copy.deepcopy(settings)
                 st.success("✅ Settings saved successfully")
             else:
                 st.error("❌ Failed to save settings")
 
     st.markdown("---")
-    st.subheader("Dashboard Information")
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        tickers = loader.get_available_tickers()
-        st.metric("Total Tickers", len(tickers))
-
-    with col2:
-        total_analyses = 0
-        for ticker in tickers:
-            summary = loader.get_ticker_summary(ticker)
-            total_analyses += summary['total_analyses']
-        st.metric("Total Analyses", total_analyses)
-
-    with col3:
-        settings_file = Path(__file__).parent.parent / "settings.json"
-        if settings_file.exists():
-            st.metric("Settings File", "✅ Exists")
-        else:
-            st.metric("Settings File", "❌ Not Found")
+    render_dashboard_info(loader)
 
     st.markdown("---")
     st.subheader("Export/Import Settings")
@@ -465,23 +533,27 @@ def render(loader):
     col1, col2 = st.columns(2)
 
     with col1:
-        settings_json = json.dumps(settings, indent=2)
+        settings_json = settings_to_json(settings)
         st.download_button(
             label="📥 Export Settings",
             data=settings_json,
             file_name="dashboard_settings.json",
-            mime="application/json"
+            mime="application/json",
+            help="Exports this session's settings, including unsaved changes"
         )
 
     with col2:
         uploaded_file = st.file_uploader("📤 Import Settings", type=['json'])
 
-        if uploaded_file is not None:
+        if uploaded_file is not None and uploaded_file.size > MAX_SETTINGS_FILE_SIZE:
+            st.error(f"Settings file too large (max {MAX_SETTINGS_FILE_SIZE // 1024} KB)")
+        elif uploaded_file is not None:
             try:
-                imported_settings = json.loads(uploaded_file.read())
+                imported_settings = json.load(uploaded_file)
                 st.session_state.settings = imported_settings
 
                 if save_settings(imported_settings):
+                    st.session_state.settings_snapshot = copy.deepcopy(imported_settings)
                     st.success("✅ Settings imported successfully")
                     st.rerun()
                 else:
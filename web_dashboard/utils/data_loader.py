@@ -1,12 +1,166 @@
 """Data loader for TradingAgents results"""
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import os
 import re
 
 
+# Decision patterns - ordered from most specific to most general. Written
+# upper-case: they are matched case-sensitively against upper-cased content.
+DECISION_PATTERNS = (
+    # Standard formats
+    r'FINAL TRANSACTION PROPOSAL:\s*\*\*(BUY|HOLD|SELL)\*\*',
+    r'FINAL TRANSACTION PROPOSAL:\s*(BUY|HOLD|SELL)',
+    r'\*\*FINAL RECOMMENDATION:\*\*\s*\*\*(BUY|HOLD|SELL)\*\*',
+    r'\*\*FINAL RECOMMENDATION:\s*(BUY|HOLD|SELL)',
+    r'FINAL RECOMMENDATION:\s*\*\*(BUY|HOLD|SELL)\*\*',
+    r'\*\*DECISION:\*\*\s*\*\*(BUY|HOLD|SELL)',
+    r'DECISION:\s*\*\*(BUY|HOLD|SELL)\*\*',
+    r'\*\*_(BUY|HOLD|SELL)_\*\*',
+    # Additional formats found in reports
+    r'\*\*DECISION:\s*(BUY|HOLD|SELL)\*\*',
+    r'DECISION:\s*(BUY|HOLD|SELL)',
+    r'\*\*FINAL DECISION:\*\*\s*\*\*(BUY|HOLD|SELL)',
+    r'FINAL DECISION:\s*\*\*(BUY|HOLD|SELL)',
+    r'\*\*RECOMMENDATION:\*\*\s*\*\*(BUY|HOLD|SELL)\*\*',
+    r'RECOMMENDATION:\s*\*\*(BUY|HOLD|SELL)\*\*',
+    # Catch patterns with extra text after decision
+    r'\*\*FINAL DECISION:\*\*\s*\*\*(HOLD|BUY|SELL)\s+\w+',
+    r'FINAL DECISION:\s*\*\*(HOLD|BUY|SELL)\s+\w+',
+)
+
+# Searched one pattern at a time, in priority order: each starts with a literal
+# that re can scan for quickly, which a combined alternation would lose. re
+# cannot use that literal prefix under IGNORECASE, hence the upper-casing.
+DECISION_REGEXES = [re.compile(pattern) for pattern in DECISION_PATTERNS]
+
+# Fundamentals metrics as (display name, pattern) pairs
+FINANCIAL_METRIC_PATTERNS = (
+    ('Market Capitalization', r'\*\*Market Capitalization\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)'),
+    ('EBITDA', r'\*\*EBITDA\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)'),
+    ('P/E', r'\*\*P/E\*\*:\s*([0-9.]+)'),
+    ('Price-to-Earnings Ratio (P/E)', r'\*\*Price-to-Earnings Ratio \(P/E\)\*\*:\s*([0-9.]+)'),
+    ('Dividend Yield', r'\*\*Dividend Yield\*\*:\s*([0-9.]+)%'),
+    ('EPS', r'\*\*EPS\*\*:\s*\$?([0-9.]+)'),
+    ('Total Revenue', r'\*\*Total Revenue\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)'),
+    ('Net Income', r'\*\*Net Income\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)'),
+    ('Operating Income', r'\*\*Operating Income\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)'),
+    ('Debt to Equity Ratio', r'\*\*Debt to Equity Ratio\*\*:\s*([0-9.]+)'),
+)
+
+# One pass over the whole report. Every metric has exactly one group, so
+# match.lastindex identifies it; [^\S\n] keeps matches within a single line.
+FINANCIAL_METRIC_NAMES = [name for name, _ in FINANCIAL_METRIC_PATTERNS]
+FINANCIAL_METRIC_PATTERN = re.compile('|'.join(
+    '(?:' + pattern.replace(r'\s', r'[^\S\n]') + ')' for _, pattern in FINANCIAL_METRIC_PATTERNS
+))
+
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Markdown table scanning: a header marker anywhere on a line starts a table,
+# whose rows are the following lines that start with '|'
+INDICATOR_TABLE_HEADER = re.compile(r'\| Indicator|\|--')
+NEWS_TABLE_HEADER = re.compile(r'\| \*\*')
+TABLE_ROW_PATTERN = re.compile(r'\|[^\n]*')
+
+
+# Subdirectory listings by directory path, as (directory mtime_ns, names).
+# Shared by every loader in the process, so all sessions and reruns reuse it.
+_subdirectory_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+
+def list_subdirectories(directory: Path) -> List[str]:
+    """List names of non-hidden subdirectories
+
+    Adding, removing or renaming an entry updates the directory's mtime, so
+    a single stat decides whether the cached listing is still valid. The
+    rescan uses os.scandir so the directory check comes from the cached
+    DirEntry instead of a separate stat call per entry.
+    """
+    key = str(directory)
+    mtime_ns = os.stat(directory).st_mtime_ns
+
+    cached = _subdirectory_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+
+    with os.scandir(directory) as entries:
+        names = [
+            entry.name for entry in entries
+            if not entry.name.startswith('.') and entry.is_dir()
+        ]
+
+    _subdirectory_cache[key] = (mtime_ns, names)
+    return list(names)
+
+
+def read_text_file(file_path: Path) -> Optional[str]:
+    """Read a UTF-8 text file, returning None if it cannot be read"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def find_decision(content: str) -> Optional[str]:
+    """Return the first BUY/HOLD/SELL decision found in report content"""
+    content = content.upper()
+
+    for pattern in DECISION_REGEXES:
+        match = pattern.search(content)
+        if match:
+            return match.group(1)
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def cached_decision(path_str: str, mtime_ns: int) -> Optional[str]:
+    """Read a decision report and extract its decision, memoized per file version
+
+    The modification time is part of the key, so a rewritten report is
+    re-read on the next call while unchanged history is never parsed twice.
+    """
+    content = read_text_file(Path(path_str))
+    return find_decision(content) if content else None
+
+
+def iter_table_rows(content: str, header_pattern: re.Pattern) -> Iterator[List[str]]:
+    """Yield the stripped cells of markdown table rows following a header line
+
+    Rows are matched in place at the current offset, so the report is never
+    split into a list of lines. Rows that themselves contain a header marker
+    (e.g. the |---| separator) are skipped.
+    """
+    pos = 0
+    while True:
+        header = header_pattern.search(content, pos)
+        if header is None:
+            return
+
+        line_end = content.find('\n', header.end())
+        if line_end == -1:
+            return
+        pos = line_end + 1
+
+        while True:
+            row = TABLE_ROW_PATTERN.match(content, pos)
+            if row is None:
+                break
+            pos = row.end() + 1
+
+            line = row.group()
+            if header_pattern.search(line):
+                continue
+            yield [part.strip() for part in line.split('|')[1:-1]]
+
+
 @dataclass
 class ReportMetadata:
     """Metadata for a trading report"""
@@ -50,11 +204,7 @@ class ResultsLoader:
 
     def get_available_tickers(self) -> List[str]:
         """Get list of all available tickers"""
-        tickers = [
-            d.name for d in self.results_dir.iterdir()
-            if d.is_dir() and not d.name.startswith('.')
-        ]
-        return sorted(tickers)
+        return sorted(list_subdirectories(self.results_dir))
 
     def get_available_dates(self, ticker: str) -> List[str]:
         """Get list of available dates for a ticker"""
@@ -63,11 +213,7 @@ class ResultsLoader:
         if not ticker_dir.exists():
             return []
 
-        dates = [
-            d.name for d in ticker_dir.iterdir()
-            if d.is_dir() and not d.name.startswith('.')
-        ]
-        return sorted(dates, reverse=True)
+        return sorted(list_subdirectories(ticker_dir), reverse=True)
 
     def get_latest_date(self, ticker: str) -> Optional[str]:
         """Get the most recent date for a ticker"""
@@ -127,11 +273,7 @@ class ResultsLoader:
         if file_path is None:
             return None
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception:
-            return None
+        return read_text_file(file_path)
 
     def extract_decision(self, content: str) -> Optional[str]:
         """Extract trading decision (BUY/HOLD/SELL) from report content
@@ -145,35 +287,35 @@ class ResultsLoader:
         if not content:
             return None
 
-        # Look for decision patterns - ordered from most specific to most general
-        patterns = [
-            # Standard formats
-            r'FINAL TRANSACTION PROPOSAL:\s*\*\*(BUY|HOLD|SELL)\*\*',
-            r'FINAL TRANSACTION PROPOSAL:\s*(BUY|HOLD|SELL)',
-            r'\*\*Final Recommendation:\*\*\s*\*\*(BUY|HOLD|SELL)\*\*',
-            r'\*\*Final Recommendation:\s*(BUY|HOLD|SELL)',
-            r'Final Recommendation:\s*\*\*(BUY|HOLD|SELL)\*\*',
-            r'\*\*Decision:\*\*\s*\*\*(BUY|HOLD|SELL)',
-            r'Decision:\s*\*\*(BUY|HOLD|SELL)\*\*',
-            r'\*\*_(BUY|HOLD|SELL)_\*\*',
-            # Additional formats found in reports
-            r'\*\*Decision:\s*(BUY|HOLD|SELL)\*\*',
-            r'Decision:\s*(BUY|HOLD|SELL)',
-            r'\*\*Final Decision:\*\*\s*\*\*(BUY|HOLD|SELL)',
-            r'Final Decision:\s*\*\*(BUY|HOLD|SELL)',
-            r'\*\*Recommendation:\*\*\s*\*\*(BUY|HOLD|SELL)\*\*',
-            r'Recommendation:\s*\*\*(BUY|HOLD|SELL)\*\*',
-            # Catch patterns with extra text after decision
-            r'\*\*Final Decision:\*\*\s*\*\*(HOLD|BUY|SELL)\s+\w+',
-            r'Final Decision:\s*\*\*(HOLD|BUY|SELL)\s+\w+',
-        ]
+        return find_decision(content)
 
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
+    def read_decision(self, ticker: str, date: str) -> Optional[str]:
+        """Get the trading decision of an analysis from its final decision report
 
-        return None
+        Args:
+            ticker: Stock ticker symbol
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            Decision string or None
+        """
+        file_path = self.results_dir / ticker / date / "reports" / "final_trade_decision.md"
+
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        return cached_decision(str(file_path), mtime_ns)
+
+    @staticmethod
+    def invalidate_decision_cache() -> None:
+        """Drop all memoized decisions
+
+        Not needed for correctness, since cached entries are keyed by file
+        modification time; use it to release memory after bulk deletions.
+        """
+        cached_decision.cache_clear()
 
     def extract_technical_indicators(self, content: str) -> Dict[str, str]:
         """Extract technical indicators from market report
@@ -189,27 +331,11 @@ class ResultsLoader:
         if not content:
             return indicators
 
-        # Look for markdown tables
-        lines = content.split('\n')
-        in_table = False
-
-        for i, line in enumerate(lines):
-            # Detect table header
-            if '| Indicator' in line or '|--' in line:
-                in_table = True
-                continue
-
-            if in_table:
-                if not line.strip() or not line.startswith('|'):
-                    in_table = False
-                    continue
-
-                # Parse table row
-                parts = [p.strip() for p in line.split('|')[1:-1]]
-                if len(parts) >= 2:
-                    indicator_name = parts[0]
-                    value = parts[1]
-                    indicators[indicator_name] = value
+        for parts in iter_table_rows(content, INDICATOR_TABLE_HEADER):
+            if len(parts) >= 2:
+                indicator_name = parts[0]
+                value = parts[1]
+                indicators[indicator_name] = value
 
         return indicators
 
@@ -227,35 +353,22 @@ class ResultsLoader:
         if not content:
             return news_sources
 
-        lines = content.split('\n')
-        in_table = False
-
-        for line in lines:
-            if '| **Topic**' in line or '| **' in line:
-                in_table = True
-                continue
-
-            if in_table:
-                if not line.strip() or not line.startswith('|'):
-                    in_table = False
-                    continue
-
-                parts = [p.strip() for p in line.split('|')[1:-1]]
-                if len(parts) >= 3:
-                    topic = parts[0].replace('**', '').strip()
-                    details = parts[1].strip()
-                    source = parts[2].strip()
-
-                    url_match = re.search(r'\[([^\]]+)\]\(([^)]+)\)', source)
-                    if url_match:
-                        source_name = url_match.group(1)
-                        source_url = url_match.group(2)
-                        news_sources.append({
-                            'topic': topic,
-                            'details': details,
-                            'source_name': source_name,
-                            'source_url': source_url
-                        })
+        for parts in iter_table_rows(content, NEWS_TABLE_HEADER):
+            if len(parts) >= 3:
+                topic = parts[0].replace('**', '').strip()
+                details = parts[1].strip()
+                source = parts[2].strip()
+
+                url_match = MARKDOWN_LINK_PATTERN.search(source)
+                if url_match:
+                    source_name = url_match.group(1)
+                    source_url = url_match.group(2)
+                    news_sources.append({
+                        'topic': topic,
+                        'details': details,
+                        'source_name': source_name,
+                        'source_url': source_url
+                    })
 
         return news_sources
 
@@ -273,25 +386,16 @@ class ResultsLoader:
         if not content:
             return metrics
 
-        lines = content.split('\n')
-
-        for line in lines:
-            for pattern in [
-                r'\*\*Market Capitalization\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)',
-                r'\*\*EBITDA\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)',
-                r'\*\*P/E\*\*:\s*([0-9.]+)',
-                r'\*\*Price-to-Earnings Ratio \(P/E\)\*\*:\s*([0-9.]+)',
-                r'\*\*Dividend Yield\*\*:\s*([0-9.]+)%',
-                r'\*\*EPS\*\*:\s*\$?([0-9.]+)',
-                r'\*\*Total Revenue\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)',
-                r'\*\*Net Income\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)',
-                r'\*\*Operating Income\*\*:\s*\$?([0-9.]+\s*[BMK]?illion)',
-                r'\*\*Debt to Equity Ratio\*\*:\s*([0-9.]+)'
-            ]:
-                match = re.search(pattern, line)
-                if match:
-                    metric_name = pattern.split(r'\*\*')[1].split(r'\*\*')[0]
-                    metrics[metric_name] = match.group(1)
+        # As with a per-line scan, the first occurrence of a metric on a line
+        # counts, later lines override earlier ones, and keys are added in
+        # line order, then metric order
+        found = {}
+        for match in FINANCIAL_METRIC_PATTERN.finditer(content):
+            line_start = content.rfind('\n', 0, match.start())
+            found.setdefault((line_start, match.lastindex), match.group(match.lastindex))
+
+        for (_, index), value in sorted(found.items()):
+            metrics[FINANCIAL_METRIC_NAMES[index - 1]] = value
 
         return metrics
 
@@ -311,14 +415,34 @@ class ResultsLoader:
         Returns:
             Dictionary mapping report types to content
         """
-        reports = {}
+        reports_dir = self.results_dir / ticker / date / "reports"
+
+        if not reports_dir.exists():
+            return {}
 
-        for report_type in self.REPORT_TYPES:
-            content = self.read_report(ticker, date, report_type, language)
-            if content:
-                reports[report_type] = content
+        # List the directory once and only open files that exist
+        with os.scandir(reports_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_file()}
 
-        return reports
+        suffix = f"_{language}" if language != "en" else ""
+        paths = {
+            report_type: reports_dir / f"{report_type}{suffix}.md"
+            for report_type in self.REPORT_TYPES
+            if f"{report_type}{suffix}.md" in existing
+        }
+
+        if not paths:
+            return {}
+
+        # I/O bound, so read concurrently (helps on network filesystems)
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            contents = dict(zip(paths, executor.map(read_text_file, paths.values())))
+
+        return {
+            report_type: contents[report_type]
+            for report_type in self.REPORT_TYPES
+            if contents.get(report_type)
+        }
 
     def get_ticker_summary(self, ticker: str) -> Dict:
         """Get summary information for a ticker
@@ -340,10 +464,7 @@ class ResultsLoader:
             }
 
         latest_date = dates[0]
-        decision_content = self.read_report(
-            ticker, latest_date, "final_trade_decision"
-        )
-        latest_decision = self.extract_decision(decision_content)
+        latest_decision = self.read_decision(ticker, latest_date)
 
         return {
             "ticker": ticker,
@@ -366,8 +487,7 @@ class ResultsLoader:
         history = []
 
         for date in dates:
-            content = self.read_report(ticker, date, "final_trade_decision")
-            decision = self.extract_decision(content)
+            decision = self.read_decision(ticker, date)
 
             history.append({
                 "date": date,
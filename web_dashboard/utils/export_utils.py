@@ -1,60 +1,149 @@
 """Export utilities for data export in various formats"""
 
-import pandas as pd
 import json
-from typing import Dict, List
-from io import BytesIO
+from typing import Dict, List, Optional
+from io import BytesIO, StringIO
 import csv
-from datetime import datetime
+import math
+import numbers
+from datetime import date, datetime
+from decimal import Decimal
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def export_to_csv(data: List[Dict], filename: str = None) -> str:
+
+def get_columns(data: List[Dict]) -> List[str]:
+    """Get table columns in order of first appearance across all rows"""
+    return list(dict.fromkeys(key for row in data for key in row))
+
+
+def export_to_csv(
+    data: List[Dict],
+    filename: str = None,
+    columns: Optional[List[str]] = None
+) -> str:
     """Export data to CSV format"""
     if not data:
         return ""
 
-    df = pd.DataFrame(data)
-    return df.to_csv(index=False)
+    if columns is None:
+        columns = get_columns(data)
+
+    output = StringIO()
+    writer = csv.DictWriter(output, fieldnames=columns, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(data)
+    return output.getvalue()
 
 
 def export_to_json(data: List[Dict], pretty: bool = True) -> str:
-    """Export data to JSON format"""
+    """Export data to JSON format
+
+    Uses orjson when it is installed. Its output differs from the json
+    module's: datetimes are written as ISO 8601, NaN and infinity as null
+    rather than NaN / Infinity, numpy values as numbers rather than their
+    str(), non-ASCII characters are left unescaped and, when not pretty,
+    there are no spaces after separators. Data orjson cannot encode, such
+    as integers wider than 64 bits, falls back to the json module.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option).decode()
+        except orjson.JSONEncodeError:
+            pass
+
     if pretty:
         return json.dumps(data, indent=2, default=str)
     return json.dumps(data, default=str)
 
 
-def export_to_excel(data: List[Dict], sheet_name: str = "Data") -> BytesIO:
-    """Export data to Excel format"""
+def to_excel_value(value):
+    """Convert a cell value to a type xlsxwriter can write
+
+    Numpy scalars and Decimals become Python numbers, NaN becomes None (an
+    empty cell) and infinities become 'inf' / '-inf', as pandas did before
+    writing. Values that aren't numbers, strings or dates, such as lists
+    and dicts, are written as their str().
+    """
+    if value is None or isinstance(value, (str, bool, date)):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, (numbers.Real, Decimal)):
+        value = float(value)
+        if value != value:
+            return None
+        if value in (math.inf, -math.inf):
+            return 'inf' if value > 0 else '-inf'
+        return value
+    return str(value)
+
+
+def export_to_excel(
+    data: List[Dict],
+    sheet_name: str = "Data",
+    columns: Optional[List[str]] = None
+) -> BytesIO:
+    """Export data to Excel format
+
+    Rows are written straight to the worksheet, tracking each column's
+    widest value as they go, instead of building a DataFrame and then
+    stringifying every column again to size it.
+    """
     output = BytesIO()
 
     if not data:
         return output
 
-    df = pd.DataFrame(data)
+    import xlsxwriter
 
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    if columns is None:
+        columns = get_columns(data)
+    col_widths = [len(str(col)) for col in columns]
 
-        workbook = writer.book
-        worksheet = writer.sheets[sheet_name]
+    workbook = xlsxwriter.Workbook(output, {'in_memory': True})
+    worksheet = workbook.add_worksheet(sheet_name)
 
-        header_format = workbook.add_format({
-            'bold': True,
-            'bg_color': '#4472C4',
-            'font_color': 'white',
-            'border': 1
-        })
+    header_format = workbook.add_format({
+        'bold': True,
+        'bg_color': '#4472C4',
+        'font_color': 'white',
+        'border': 1
+    })
+    datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+    date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
 
-        for col_num, value in enumerate(df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
+    worksheet.write_row(0, 0, columns, header_format)
 
-        for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).map(len).max(),
-                len(str(col))
-            )
-            worksheet.set_column(idx, idx, max_length + 2)
+    for row_num, row in enumerate(data, 1):
+        for col_num, col in enumerate(columns):
+            value = to_excel_value(row.get(col))
+
+            if value is None:
+                continue
+
+            if isinstance(value, datetime):
+                worksheet.write_datetime(row_num, col_num, value, datetime_format)
+            elif isinstance(value, date):
+                worksheet.write_datetime(row_num, col_num, value, date_format)
+            else:
+                worksheet.write(row_num, col_num, value)
+
+            width = len(str(value))
+            if width > col_widths[col_num]:
+                col_widths[col_num] = width
+
+    for col_num, width in enumerate(col_widths):
+        worksheet.set_column(col_num, col_num, width + 2)
+
+    workbook.close()
 
     output.seek(0)
     return output
@@ -62,135 +151,137 @@ def export_to_excel(data: List[Dict], sheet_name: str = "Data") -> BytesIO:
 
 def export_portfolio_report(positions: List[Dict], metrics: Dict) -> str:
     """Generate comprehensive portfolio report in markdown"""
-    report = f"# Portfolio Report\n\n"
-    report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-    report += "## Portfolio Summary\n\n"
-    report += f"- **Total Value:** ${metrics.get('total_value', 0):,.2f}\n"
-    report += f"- **Total Cost:** ${metrics.get('total_cost', 0):,.2f}\n"
-    report += f"- **Gain/Loss:** ${metrics.get('total_gain_loss', 0):,.2f}\n"
-    report += f"- **Total Return:** {metrics.get('total_return', 0):.2f}%\n"
-    report += f"- **Number of Positions:** {metrics.get('num_positions', 0)}\n\n"
+    parts = [
+        "# Portfolio Report\n\n",
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        "## Portfolio Summary\n\n",
+        f"- **Total Value:** ${metrics.get('total_value', 0):,.2f}\n",
+        f"- **Total Cost:** ${metrics.get('total_cost', 0):,.2f}\n",
+        f"- **Gain/Loss:** ${metrics.get('total_gain_loss', 0):,.2f}\n",
+        f"- **Total Return:** {metrics.get('total_return', 0):.2f}%\n",
+        f"- **Number of Positions:** {metrics.get('num_positions', 0)}\n\n",
+    ]
 
     if positions:
-        report += "## Position Details\n\n"
-        report += "| Ticker | Shares | Avg Price | Current Price | Cost Basis | Current Value | Gain/Loss | Return (%) |\n"
-        report += "|--------|--------|-----------|---------------|------------|---------------|-----------|------------|\n"
+        parts.append("## Position Details\n\n")
+        parts.append("| Ticker | Shares | Avg Price | Current Price | Cost Basis | Current Value | Gain/Loss | Return (%) |\n")
+        parts.append("|--------|--------|-----------|---------------|------------|---------------|-----------|------------|\n")
 
         for pos in positions:
             gain_loss = pos['current_value'] - pos['cost_basis']
             return_pct = (gain_loss / pos['cost_basis'] * 100) if pos['cost_basis'] > 0 else 0
 
-            report += f"| {pos['ticker']} | "
-            report += f"{pos['shares']:.2f} | "
-            report += f"${pos['avg_price']:.2f} | "
-            report += f"${pos['current_price']:.2f} | "
-            report += f"${pos['cost_basis']:.2f} | "
-            report += f"${pos['current_value']:.2f} | "
-            report += f"${gain_loss:.2f} | "
-            report += f"{return_pct:.2f}% |\n"
+            parts.append(
+                f"| {pos['ticker']} | {pos['shares']:.2f} | ${pos['avg_price']:.2f} | "
+                f"${pos['current_price']:.2f} | ${pos['cost_basis']:.2f} | "
+                f"${pos['current_value']:.2f} | ${gain_loss:.2f} | {return_pct:.2f}% |\n"
+            )
 
-    return report
+    return ''.join(parts)
 
 
 def export_backtest_report(ticker: str, backtest_results: Dict, metrics: Dict) -> str:
     """Generate backtest analysis report in markdown"""
-    report = f"# Backtest Report: {ticker}\n\n"
-    report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-    report += "## Strategy Performance\n\n"
-    report += f"- **Initial Capital:** ${backtest_results['initial_capital']:,.2f}\n"
-    report += f"- **Final Value:** ${backtest_results['final_value']:,.2f}\n"
-    report += f"- **Total Return:** {backtest_results['total_return']:.2f}%\n"
-    report += f"- **Number of Trades:** {backtest_results['num_trades']}\n\n"
-
-    report += "## Risk Metrics\n\n"
-    report += f"- **Sharpe Ratio:** {metrics.get('sharpe_ratio', 0):.2f}\n"
-    report += f"- **Max Drawdown:** {metrics.get('max_drawdown', 0):.2f}%\n"
-    report += f"- **Win Rate:** {metrics.get('win_rate', 0):.1f}%\n\n"
+    parts = [
+        f"# Backtest Report: {ticker}\n\n",
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        "## Strategy Performance\n\n",
+        f"- **Initial Capital:** ${backtest_results['initial_capital']:,.2f}\n",
+        f"- **Final Value:** ${backtest_results['final_value']:,.2f}\n",
+        f"- **Total Return:** {backtest_results['total_return']:.2f}%\n",
+        f"- **Number of Trades:** {backtest_results['num_trades']}\n\n",
+        "## Risk Metrics\n\n",
+        f"- **Sharpe Ratio:** {metrics.get('sharpe_ratio', 0):.2f}\n",
+        f"- **Max Drawdown:** {metrics.get('max_drawdown', 0):.2f}%\n",
+        f"- **Win Rate:** {metrics.get('win_rate', 0):.1f}%\n\n",
+    ]
 
     if backtest_results['trades']:
-        report += "## Trade History\n\n"
-        report += "| Date | Action | Shares | Price | Value |\n"
-        report += "|------|--------|--------|-------|-------|\n"
+        parts.append("## Trade History\n\n")
+        parts.append("| Date | Action | Shares | Price | Value |\n")
+        parts.append("|------|--------|--------|-------|-------|\n")
 
-        for trade in backtest_results['trades']:
-            report += f"| {trade['date']} | "
-            report += f"{trade['action']} | "
-            report += f"{trade['shares']} | "
-            report += f"${trade['price']:.2f} | "
-            report += f"${trade['value']:.2f} |\n"
+        parts.extend(
+            f"| {trade['date']} | {trade['action']} | {trade['shares']} | "
+            f"${trade['price']:.2f} | ${trade['value']:.2f} |\n"
+            for trade in backtest_results['trades']
+        )
 
-    return report
+    return ''.join(parts)
 
 
 def export_comparison_report(tickers: List[str], comparison_data: List[Dict]) -> str:
     """Generate multi-ticker comparison report"""
-    report = "# Multi-Ticker Comparison Report\n\n"
-    report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-    report += f"**Tickers Analyzed:** {', '.join(tickers)}\n\n"
+    parts = [
+        "# Multi-Ticker Comparison Report\n\n",
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"**Tickers Analyzed:** {', '.join(tickers)}\n\n",
+        "## Performance Comparison\n\n",
+        "| Ticker | Latest Date | Latest Decision | Total Analyses |\n",
+        "|--------|-------------|-----------------|----------------|\n",
+    ]
 
-    report += "## Performance Comparison\n\n"
-    report += "| Ticker | Latest Date | Latest Decision | Total Analyses |\n"
-    report += "|--------|-------------|-----------------|----------------|\n"
+    parts.extend(
+        f"| {data['Ticker']} | {data['Latest Date']} | "
+        f"{data['Latest Decision']} | {data['Total Analyses']} |\n"
+        for data in comparison_data
+    )
 
-    for data in comparison_data:
-        report += f"| {data['Ticker']} | "
-        report += f"{data['Latest Date']} | "
-        report += f"{data['Latest Decision']} | "
-        report += f"{data['Total Analyses']} |\n"
-
-    return report
+    return ''.join(parts)
 
 
 def export_alerts_report(alerts: List[Dict], triggered_alerts: List[Dict]) -> str:
     """Generate alerts summary report"""
-    report = "# Trading Alerts Report\n\n"
-    report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-
-    report += f"## Summary\n\n"
-    report += f"- **Active Alerts:** {len([a for a in alerts if a.get('active', True)])}\n"
-    report += f"- **Triggered Alerts:** {len(triggered_alerts)}\n\n"
-
     active_alerts = [a for a in alerts if a.get('active', True)]
 
+    parts = [
+        "# Trading Alerts Report\n\n",
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        "## Summary\n\n",
+        f"- **Active Alerts:** {len(active_alerts)}\n",
+        f"- **Triggered Alerts:** {len(triggered_alerts)}\n\n",
+    ]
+
     if active_alerts:
-        report += "## Active Alerts\n\n"
-        report += "| Ticker | Type | Created At | Status |\n"
-        report += "|--------|------|------------|--------|\n"
+        parts.append("## Active Alerts\n\n")
+        parts.append("| Ticker | Type | Created At | Status |\n")
+        parts.append("|--------|------|------------|--------|\n")
 
-        for alert in active_alerts:
-            report += f"| {alert['ticker']} | "
-            report += f"{alert['type']} | "
-            report += f"{alert['created_at']} | "
-            report += f"{'Triggered' if alert.get('triggered', False) else 'Active'} |\n"
+        parts.extend(
+            f"| {alert['ticker']} | {alert['type']} | {alert['created_at']} | "
+            f"{'Triggered' if alert.get('triggered', False) else 'Active'} |\n"
+            for alert in active_alerts
+        )
 
     if triggered_alerts:
-        report += "\n## Triggered Alerts History\n\n"
-        report += "| Ticker | Type | Triggered At | Trigger Value |\n"
-        report += "|--------|------|--------------|---------------|\n"
+        parts.append("\n## Triggered Alerts History\n\n")
+        parts.append("| Ticker | Type | Triggered At | Trigger Value |\n")
+        parts.append("|--------|------|--------------|---------------|\n")
 
-        for alert in triggered_alerts:
-            report += f"| {alert['ticker']} | "
-            report += f"{alert['type']} | "
-            report += f"{alert.get('triggered_at', 'N/A')} | "
-            report += f"{alert.get('trigger_value', 'N/A')} |\n"
+        parts.extend(
+            f"| {alert['ticker']} | {alert['type']} | "
+            f"{alert.get('triggered_at', 'N/A')} | {alert.get('trigger_value', 'N/A')} |\n"
+            for alert in triggered_alerts
+        )
 
-    return report
+    return ''.join(parts)
 
 
 def prepare_export_data(data_type: str, data: Dict) -> Dict:
-    """Prepare data for export based on type"""
+    """Prepare data for export based on type
+
+    The CSV and Excel exports of a dataset share a single column scan.
+    """
     export_formats = {}
 
     if data_type == "portfolio":
         positions = data.get('positions', [])
         metrics = data.get('metrics', {})
+        columns = get_columns(positions)
 
-        export_formats['csv'] = export_to_csv(positions)
+        export_formats['csv'] = export_to_csv(positions, columns=columns)
         export_formats['json'] = export_to_json(positions)
-        export_formats['excel'] = export_to_excel(positions, sheet_name="Portfolio")
+        export_formats['excel'] = export_to_excel(positions, sheet_name="Portfolio", columns=columns)
         export_formats['report'] = export_portfolio_report(positions, metrics)
 
     elif data_type == "backtest":
@@ -199,18 +290,20 @@ def prepare_export_data(data_type: str, data: Dict) -> Dict:
         metrics = data.get('metrics', {})
 
         trades = results.get('trades', [])
-        export_formats['csv'] = export_to_csv(trades)
+        columns = get_columns(trades)
+        export_formats['csv'] = export_to_csv(trades, columns=columns)
         export_formats['json'] = export_to_json(results)
-        export_formats['excel'] = export_to_excel(trades, sheet_name="Trades")
+        export_formats['excel'] = export_to_excel(trades, sheet_name="Trades", columns=columns)
         export_formats['report'] = export_backtest_report(ticker, results, metrics)
 
     elif data_type == "comparison":
         comparison_data = data.get('data', [])
         tickers = data.get('tickers', [])
+        columns = get_columns(comparison_data)
 
-        export_formats['csv'] = export_to_csv(comparison_data)
+        export_formats['csv'] = export_to_csv(comparison_data, columns=columns)
         export_formats['json'] = export_to_json(comparison_data)
-        export_formats['excel'] = export_to_excel(comparison_data, sheet_name="Comparison")
+        export_formats['excel'] = export_to_excel(comparison_data, sheet_name="Comparison", columns=columns)
         export_formats['report'] = export_comparison_report(tickers, comparison_data)
 
     elif data_type == "alerts":
@@ -0,0 +1,48 @@
+"""Keyword matching utilities for text analysis"""
+
+from typing import Iterable, Set
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of keywords occur in a text
+
+    Keywords match as plain substrings, so callers normalize case first.
+    With pyahocorasick installed, every keyword is found in a single pass
+    over the text; otherwise each keyword is checked with a substring test.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """Initialize keyword matcher
+
+        Args:
+            keywords: Keywords to look for
+        """
+        self.keywords = tuple(dict.fromkeys(keywords))
+
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+        else:
+            self.automaton = None
+
+    def find(self, text: str) -> Set[str]:
+        """Find the keywords occurring in text
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Set of keywords found at least once
+        """
+        if self.automaton is not None:
+            return {keyword for _, keyword in self.automaton.iter(text)}
+
+        return {keyword for keyword in self.keywords if keyword in text}
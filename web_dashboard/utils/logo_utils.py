@@ -1,13 +1,128 @@
 """Utilities for fetching and displaying company logos"""
 
 import streamlit as st
-from typing import Optional
-import yfinance as yf
+from typing import Dict, List, Optional
 from pathlib import Path
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
+import os
+import threading
+import time
 from io import BytesIO
 
 
+RESULTS_DIR = Path(__file__).parent.parent.parent / "results"
+LOGO_CACHE_FILE = RESULTS_DIR / ".logo_cache" / "logo_urls.json"
+LOGO_CACHE_TTL = 86400
+
+# Known company domains by cleaned ticker
+DOMAIN_MAPPING = {
+    'aapl': 'apple.com',
+    'msft': 'microsoft.com',
+    'googl': 'google.com',
+    'goog': 'google.com',
+    'amzn': 'amazon.com',
+    'meta': 'meta.com',
+    'tsla': 'tesla.com',
+    'nvda': 'nvidia.com',
+    'avgo': 'broadcom.com',
+    'ibm': 'ibm.com',
+    'orcl': 'oracle.com',
+    'intc': 'intel.com',
+    'amd': 'amd.com',
+    'nflx': 'netflix.com',
+    'dis': 'disney.com',
+    'ba': 'boeing.com',
+    'jpm': 'jpmorganchase.com',
+    'v': 'visa.com',
+    'ma': 'mastercard.com',
+    'wmt': 'walmart.com',
+    'ko': 'coca-cola.com',
+    'pfe': 'pfizer.com',
+    'jnj': 'jnj.com',
+    'pg': 'pg.com',
+    'bac': 'bankofamerica.com',
+    'csco': 'cisco.com',
+    'adbe': 'adobe.com',
+    'crm': 'salesforce.com',
+    'petr4': 'petrobras.com.br',
+    'vale3': 'vale.com',
+    'itub4': 'itau.com.br',
+    'bbdc4': 'bb.com.br',
+}
+
+DECISION_COLORS = {
+    'BUY': '#10b981',
+    'HOLD': '#f59e0b',
+    'SELL': '#ef4444'
+}
+
+# Logo URLs for the known domains, served without any network check
+KNOWN_LOGO_URLS = {
+    ticker: f"https://logo.clearbit.com/{domain}"
+    for ticker, domain in DOMAIN_MAPPING.items()
+}
+
+# Deletes the characters dropped from tickers before the domain lookup
+TICKER_CLEAN_TABLE = str.maketrans('', '', '-')
+
+# ticker -> [logo URL or None, unix time it was looked up], mirrored to disk
+# so lookups survive app restarts
+_logo_cache: Optional[Dict[str, list]] = None
+_logo_cache_lock = threading.Lock()
+
+
+def _load_logo_cache() -> Dict[str, list]:
+    """Return the logo URL cache, reading it from disk on first use"""
+    global _logo_cache
+
+    if _logo_cache is None:
+        try:
+            with open(LOGO_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _logo_cache = json.load(f)
+        except Exception:
+            _logo_cache = {}
+
+    return _logo_cache
+
+
+def _get_cached_logo(ticker: str) -> Optional[list]:
+    """Return the cached [url, checked_ts] entry for a ticker if still fresh"""
+    with _logo_cache_lock:
+        entry = _load_logo_cache().get(ticker)
+
+    if entry and time.time() - entry[1] < LOGO_CACHE_TTL:
+        return entry
+    return None
+
+
+def _store_logos(logos: Dict[str, Optional[str]]):
+    """Record looked-up logo URLs in memory and persist them to disk"""
+    checked_ts = time.time()
+
+    with _logo_cache_lock:
+        cache = _load_logo_cache()
+        for ticker, url in logos.items():
+            cache[ticker] = [url, checked_ts]
+
+        # Don't create the results directory just to hold the cache
+        if not RESULTS_DIR.exists():
+            return
+
+        temp_file = LOGO_CACHE_FILE.with_suffix('.json.tmp')
+        try:
+            LOGO_CACHE_FILE.parent.mkdir(exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(temp_file, LOGO_CACHE_FILE)
+        except Exception:
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+
+
 @st.cache_data(ttl=86400)
 def get_company_logo_url(ticker: str) -> Optional[str]:
     """Get company logo URL from various sources
@@ -18,6 +133,82 @@ def get_company_logo_url(ticker: str) -> Optional[str]:
     Returns:
         Logo URL or None if not found
     """
+    known_url = KNOWN_LOGO_URLS.get(clean_ticker(ticker))
+    if known_url:
+        return known_url
+
+    entry = _get_cached_logo(ticker)
+    if entry is not None:
+        return entry[0]
+
+    logo_url = lookup_logo_url(ticker)
+    _store_logos({ticker: logo_url})
+    return logo_url
+
+
+def get_logos_bulk(tickers: List[str]) -> Dict[str, Optional[str]]:
+    """Get logo URLs for several tickers, looking up uncached ones in parallel
+
+    Args:
+        tickers: Stock ticker symbols
+
+    Returns:
+        Dictionary mapping each ticker to its logo URL or None
+    """
+    logos = {}
+    missing = []
+
+    for ticker in dict.fromkeys(tickers):
+        known_url = KNOWN_LOGO_URLS.get(clean_ticker(ticker))
+        if known_url:
+            logos[ticker] = known_url
+            continue
+
+        entry = _get_cached_logo(ticker)
+        if entry is not None:
+            logos[ticker] = entry[0]
+        else:
+            missing.append(ticker)
+
+    if missing:
+        # Each lookup is a network round trip, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+            fetched = dict(zip(missing, executor.map(lookup_logo_url, missing)))
+        _store_logos(fetched)
+        logos.update(fetched)
+
+    return logos
+
+
+@lru_cache(maxsize=1)
+def get_http_session():
+    """Get the shared HTTP session for logo requests
+
+    Reusing one session keeps connections to the logo hosts alive across
+    lookups, sized for the parallel workers in get_logos_bulk.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def lookup_logo_url(ticker: str) -> Optional[str]:
+    """Look up a company logo URL over the network, bypassing all caches
+
+    Args:
+        ticker: Stock ticker symbol
+
+    Returns:
+        Logo URL or None if not found
+    """
+    # Deferred so importing this module for the HTML helpers stays cheap
+    import yfinance as yf
+
     try:
         stock = yf.Ticker(ticker)
         info = stock.info
@@ -31,7 +222,7 @@ def get_company_logo_url(ticker: str) -> Optional[str]:
 
     try:
         clearbit_url = f"https://logo.clearbit.com/{get_domain_from_ticker(ticker)}"
-        response = requests.head(clearbit_url, timeout=2)
+        response = get_http_session().head(clearbit_url, timeout=2)
         if response.status_code == 200:
             return clearbit_url
     except Exception:
@@ -40,6 +231,18 @@ def get_company_logo_url(ticker: str) -> Optional[str]:
     return None
 
 
+def clean_ticker(ticker: str) -> str:
+    """Normalize a ticker for the domain and logo tables
+
+    Args:
+        ticker: Stock ticker symbol
+
+    Returns:
+        Lower-case ticker without exchange suffix or dashes
+    """
+    return ticker.replace('.SA', '').translate(TICKER_CLEAN_TABLE).lower()
+
+
 def get_domain_from_ticker(ticker: str) -> str:
     """Convert ticker to likely company domain
 
@@ -49,44 +252,9 @@ def get_domain_from_ticker(ticker: str) -> str:
     Returns:
         Company domain guess
     """
-    ticker_clean = ticker.replace('.SA', '').replace('-', '').lower()
-
-    domain_mapping = {
-        'aapl': 'apple.com',
-        'msft': 'microsoft.com',
-        'googl': 'google.com',
-        'goog': 'google.com',
-        'amzn': 'amazon.com',
-        'meta': 'meta.com',
-        'tsla': 'tesla.com',
-        'nvda': 'nvidia.com',
-        'avgo': 'broadcom.com',
-        'ibm': 'ibm.com',
-        'orcl': 'oracle.com',
-        'intc': 'intel.com',
-        'amd': 'amd.com',
-        'nflx': 'netflix.com',
-        'dis': 'disney.com',
-        'ba': 'boeing.com',
-        'jpm': 'jpmorganchase.com',
-        'v': 'visa.com',
-        'ma': 'mastercard.com',
-        'wmt': 'walmart.com',
-        'ko': 'coca-cola.com',
-        'pfe': 'pfizer.com',
-        'jnj': 'jnj.com',
-        'pg': 'pg.com',
-        'bac': 'bankofamerica.com',
-        'csco': 'cisco.com',
-        'adbe': 'adobe.com',
-        'crm': 'salesforce.com',
-        'petr4': 'petrobras.com.br',
-        'vale3': 'vale.com',
-        'itub4': 'itau.com.br',
-        'bbdc4': 'bb.com.br',
-    }
-
-    return domain_mapping.get(ticker_clean, f"{ticker_clean}.com")
+    ticker_clean = clean_ticker(ticker)
+
+    return DOMAIN_MAPPING.get(ticker_clean, f"{ticker_clean}.com")
 
 
 def display_ticker_with_logo(ticker: str, size: int = 20) -> str:
@@ -99,8 +267,12 @@ def display_ticker_with_logo(ticker: str, size: int = 20) -> str:
     Returns:
         HTML string with logo and ticker
     """
-    logo_url = get_company_logo_url(ticker)
+    return build_ticker_html(ticker, get_company_logo_url(ticker), size)
+
 
+@lru_cache(maxsize=1024)
+def build_ticker_html(ticker: str, logo_url: Optional[str], size: int) -> str:
+    """Build the ticker-with-logo HTML, memoized since inputs repeat every rerun"""
     if logo_url:
         return f'''
         <div style="display: flex; align-items: center; gap: 8px;">
@@ -153,7 +325,7 @@ def get_logo_as_bytes(ticker: str) -> Optional[BytesIO]:
         return None
 
     try:
-        response = requests.get(logo_url, timeout=5)
+        response = get_http_session().get(logo_url, timeout=5)
         if response.status_code == 200:
             return BytesIO(response.content)
     except Exception:
@@ -172,17 +344,15 @@ def create_ticker_badge(ticker: str, decision: Optional[str] = None) -> str:
     Returns:
         HTML string with styled badge
     """
-    logo_url = get_company_logo_url(ticker)
+    return build_badge_html(ticker, decision, get_company_logo_url(ticker))
 
-    decision_colors = {
-        'BUY': '#10b981',
-        'HOLD': '#f59e0b',
-        'SELL': '#ef4444'
-    }
 
+@lru_cache(maxsize=1024)
+def build_badge_html(ticker: str, decision: Optional[str], logo_url: Optional[str]) -> str:
+    """Build the ticker badge HTML, memoized since inputs repeat every rerun"""
     decision_html = ''
     if decision:
-        color = decision_colors.get(decision, '#6b7280')
+        color = DECISION_COLORS.get(decision, '#6b7280')
         decision_html = f'''
         <span style="background-color: {color}; color: white; padding: 2px 8px;
                      border-radius: 4px; font-size: 11px; font-weight: 600; margin-left: 8px;">
@@ -2,17 +2,86 @@
 
 import streamlit as st
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import re
 from pathlib import Path
+import html
+import json
 import os
+import threading
+import time
+
+from .keyword_utils import KeywordMatcher
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+RESULTS_DIR = Path(__file__).parent.parent.parent / "results"
+NEWS_CACHE_DIR = RESULTS_DIR / ".news_cache"
+NEWS_CACHE_TTL = 3600
+
+# Non-empty provider responses as cache name -> (fetched_at, articles),
+# in front of the disk cache
+_news_memory_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+
+# Failed or empty provider responses as cache name -> time before which
+# they are not requested again, so reruns don't re-spend quota or wait on
+# timeouts
+NEWS_FAILURE_TTL = 300
+_news_failures: Dict[str, float] = {}
+
+# Alpha Vantage answers rate-limited or rejected requests with HTTP 200 and
+# a "Note"/"Information" message; further requests are skipped for a while
+ALPHAVANTAGE_BACKOFF = 300
+_alphavantage_backoff_until = 0.0
+
+# Shared by all requests so connections to the news APIs are kept alive
+# across fetches instead of paying a new TCP/TLS handshake each time
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Keywords for the simple headline sentiment
+POSITIVE_KEYWORDS = frozenset([
+    'rise', 'gain', 'profit', 'growth', 'bull', 'positive', 'surge',
+    'jump', 'rally', 'upgrade', 'beat', 'strong', 'boost', 'win'
+])
+NEGATIVE_KEYWORDS = frozenset([
+    'fall', 'loss', 'decline', 'bear', 'negative', 'drop',
+    'plunge', 'downgrade', 'miss', 'weak', 'concern', 'risk'
+])
+SENTIMENT_KEYWORD_MATCHER = KeywordMatcher(POSITIVE_KEYWORDS | NEGATIVE_KEYWORDS)
+
+SENTIMENT_EMOJIS = {
+    'positive': '🟢',
+    'negative': '🔴',
+    'neutral': '⚪'
+}
+SENTIMENT_COLORS = {
+    'positive': '#10b981',
+    'negative': '#ef4444',
+    'neutral': '#6b7280'
+}
+
+# Titles are compared with punctuation stripped; reworded copies of the
+# same headline are caught by the overlap of their character 3-grams
+TITLE_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+TITLE_SHINGLE_SIZE = 3
+TITLE_SIMILARITY_THRESHOLD = 0.85
 
 
-@st.cache_data(ttl=1800)
 def fetch_news_from_newsapi(ticker: str, api_key: Optional[str] = None, max_results: int = 10) -> List[Dict]:
     """Fetch news from NewsAPI
 
+    Articles are cached for NEWS_CACHE_TTL; failures and empty responses
+    are not requested again for NEWS_FAILURE_TTL.
+
     Args:
         ticker: Stock ticker symbol
         api_key: NewsAPI key
@@ -24,6 +93,14 @@ def fetch_news_from_newsapi(ticker: str, api_key: Optional[str] = None, max_resu
     if not api_key:
         return []
 
+    cache_name = f"newsapi_{ticker}_{max_results}"
+    cached = read_news_cache(cache_name)
+    if cached is not None:
+        return cached
+
+    if is_news_failure_fresh(cache_name):
+        return []
+
     try:
         company_name = get_company_name(ticker)
 
@@ -39,10 +116,10 @@ def fetch_news_from_newsapi(ticker: str, api_key: Optional[str] = None, max_resu
             'apiKey': api_key
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        response = HTTP_SESSION.get(url, params=params, timeout=10)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json_response(response)
             articles = []
 
             for article in data.get('articles', []):
@@ -55,18 +132,23 @@ def fetch_news_from_newsapi(ticker: str, api_key: Optional[str] = None, max_resu
                     'sentiment': analyze_sentiment_simple(article.get('title', '') + ' ' + article.get('description', ''))
                 })
 
-            return articles
+            if articles:
+                write_news_cache(cache_name, articles)
+                return articles
 
     except Exception:
-        return []
+        pass
 
+    mark_news_failure(cache_name)
     return []
 
 
-@st.cache_data(ttl=1800)
 def fetch_news_from_alphavantage(ticker: str, api_key: Optional[str] = None) -> List[Dict]:
     """Fetch news from Alpha Vantage
 
+    Articles are cached for NEWS_CACHE_TTL; failures and empty responses
+    are not requested again for NEWS_FAILURE_TTL.
+
     Args:
         ticker: Stock ticker symbol
         api_key: Alpha Vantage API key
@@ -77,6 +159,16 @@ def fetch_news_from_alphavantage(ticker: str, api_key: Optional[str] = None) ->
     if not api_key:
         return []
 
+    global _alphavantage_backoff_until
+
+    cache_name = f"alphavantage_{ticker}"
+    cached = read_news_cache(cache_name)
+    if cached is not None:
+        return cached
+
+    if time.time() < _alphavantage_backoff_until or is_news_failure_fresh(cache_name):
+        return []
+
     try:
         url = f"https://www.alphavantage.co/query"
         params = {
@@ -86,13 +178,13 @@ def fetch_news_from_alphavantage(ticker: str, api_key: Optional[str] = None) ->
             'limit': 50
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        response = HTTP_SESSION.get(url, params=params, timeout=10)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json_response(response)
 
-            if 'feed' not in data:
-                return []
+            if 'Note' in data or 'Information' in data:
+                _alphavantage_backoff_until = time.time() + ALPHAVANTAGE_BACKOFF
 
             articles = []
 
@@ -107,14 +199,127 @@ def fetch_news_from_alphavantage(ticker: str, api_key: Optional[str] = None) ->
                     'sentiment_score': item.get('overall_sentiment_score', 0)
                 })
 
-            return articles
+            if articles:
+                write_news_cache(cache_name, articles)
+                return articles
 
     except Exception:
-        return []
+        pass
 
+    mark_news_failure(cache_name)
     return []
 
 
+def parse_json_response(response: requests.Response):
+    """Parse a JSON response body, with orjson when it is installed
+
+    Args:
+        response: HTTP response from a news API
+
+    Returns:
+        Parsed JSON data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def get_news_cache_file(cache_name: str) -> Path:
+    """Get the disk cache file for a provider response
+
+    Args:
+        cache_name: Provider and request key
+
+    Returns:
+        Path of the cache file
+    """
+    return NEWS_CACHE_DIR / (re.sub(r'[^\w.-]', '_', cache_name) + '.json')
+
+
+def read_news_cache(cache_name: str) -> Optional[List[Dict]]:
+    """Read cached provider articles
+
+    Only non-empty responses are cached here, for NEWS_CACHE_TTL; failures
+    are tracked separately for the shorter NEWS_FAILURE_TTL (see
+    mark_news_failure). Entries live in memory and on disk; the disk copy
+    lets app restarts and other server processes reuse news fetched
+    recently instead of spending API quota.
+
+    Args:
+        cache_name: Provider and request key
+
+    Returns:
+        Cached articles, or None if missing or older than NEWS_CACHE_TTL
+    """
+    entry = _news_memory_cache.get(cache_name)
+
+    if entry is None:
+        try:
+            with open(get_news_cache_file(cache_name), 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            entry = (saved['fetched_at'], saved['articles'])
+        except Exception:
+            return None
+        _news_memory_cache[cache_name] = entry
+
+    fetched_at, articles = entry
+    if time.time() - fetched_at >= NEWS_CACHE_TTL:
+        return None
+    return articles
+
+
+def mark_news_failure(cache_name: str):
+    """Record a failed or empty provider response
+
+    Args:
+        cache_name: Provider and request key
+    """
+    _news_failures[cache_name] = time.time() + NEWS_FAILURE_TTL
+
+
+def is_news_failure_fresh(cache_name: str) -> bool:
+    """Check whether a request failed or came back empty within NEWS_FAILURE_TTL
+
+    Args:
+        cache_name: Provider and request key
+
+    Returns:
+        True if the request should not be retried yet
+    """
+    return time.time() < _news_failures.get(cache_name, 0)
+
+
+def write_news_cache(cache_name: str, articles: List[Dict]):
+    """Cache provider articles in memory and on disk
+
+    Args:
+        cache_name: Provider and request key
+        articles: Articles to cache
+    """
+    # Empty results are tracked by mark_news_failure for a shorter time
+    if not articles:
+        return
+
+    fetched_at = time.time()
+    _news_memory_cache[cache_name] = (fetched_at, articles)
+
+    if not RESULTS_DIR.exists():
+        return
+
+    cache_file = get_news_cache_file(cache_name)
+    temp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+    try:
+        NEWS_CACHE_DIR.mkdir(exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'fetched_at': fetched_at, 'articles': articles}, f)
+        os.replace(temp_file, cache_file)
+    except Exception:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+
+
 def get_company_name(ticker: str) -> str:
     """Get company name from ticker
 
@@ -174,16 +379,9 @@ def analyze_sentiment_simple(text: str) -> str:
     if not text:
         return 'neutral'
 
-    text_lower = text.lower()
-
-    positive_words = ['rise', 'gain', 'profit', 'growth', 'bull', 'positive', 'surge',
-                      'jump', 'rally', 'upgrade', 'beat', 'strong', 'boost', 'win']
-
-    negative_words = ['fall', 'loss', 'decline', 'bear', 'negative', 'drop',
-                      'plunge', 'downgrade', 'miss', 'weak', 'concern', 'risk']
-
-    positive_count = sum(1 for word in positive_words if word in text_lower)
-    negative_count = sum(1 for word in negative_words if word in text_lower)
+    found = SENTIMENT_KEYWORD_MATCHER.find(text.lower())
+    positive_count = len(found & POSITIVE_KEYWORDS)
+    negative_count = len(found & NEGATIVE_KEYWORDS)
 
     if positive_count > negative_count:
         return 'positive'
@@ -219,13 +417,7 @@ def get_sentiment_emoji(sentiment: str) -> str:
     Returns:
         Emoji string
     """
-    emoji_map = {
-        'positive': '🟢',
-        'negative': '🔴',
-        'neutral': '⚪'
-    }
-
-    return emoji_map.get(sentiment, '⚪')
+    return SENTIMENT_EMOJIS.get(sentiment, '⚪')
 
 
 def get_sentiment_color(sentiment: str) -> str:
@@ -237,13 +429,7 @@ def get_sentiment_color(sentiment: str) -> str:
     Returns:
         Color hex code
     """
-    color_map = {
-        'positive': '#10b981',
-        'negative': '#ef4444',
-        'neutral': '#6b7280'
-    }
-
-    return color_map.get(sentiment, '#6b7280')
+    return SENTIMENT_COLORS.get(sentiment, '#6b7280')
 
 
 def format_published_date(date_str: str) -> str:
@@ -285,59 +471,109 @@ def format_published_date(date_str: str) -> str:
         return date_str
 
 
-def render_news_card(article: Dict, show_description: bool = True):
-    """Render news article as a styled card
+def clean_card_text(text) -> str:
+    """Collapse whitespace and escape text for use inside card HTML
+
+    st.markdown dedents the block and a blank or indented line ends the HTML
+    block, so a stray newline in a headline would turn the rest of the card
+    into a code block.
+    """
+    return html.escape(' '.join(str(text or '').split()))
+
+
+def build_news_card_html(article: Dict, show_description: bool = True) -> str:
+    """Build the HTML for a news article card
+
+    Lines are kept flush left and free of blank lines so the card stays a
+    single markdown HTML block however many cards are joined together.
 
     Args:
         article: Article dictionary
         show_description: Whether to show full description
+
+    Returns:
+        Card HTML, including the description and Read More link
     """
     sentiment = article.get('sentiment', 'neutral')
     sentiment_emoji = get_sentiment_emoji(sentiment)
     sentiment_color = get_sentiment_color(sentiment)
 
-    published = format_published_date(article.get('publishedAt', ''))
-    source = article.get('source', 'Unknown')
-    title = article.get('title', 'No title')
-    description = article.get('description', '')
+    published = clean_card_text(format_published_date(article.get('publishedAt', '')))
+    source = clean_card_text(article.get('source', 'Unknown'))
+    title = clean_card_text(article.get('title', 'No title'))
+    description = clean_card_text(article.get('description', ''))
     url = article.get('url', '#')
 
-    card_html = f'''
-    <div style="border-left: 4px solid {sentiment_color}; padding: 16px; margin-bottom: 16px;
-                background: #f8fafc; border-radius: 8px;">
-        <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 8px;">
-            <div style="flex: 1;">
-                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 4px;">
-                    <span style="font-size: 12px; font-weight: 600; color: #64748b;">
-                        {source}
-                    </span>
-                    <span style="font-size: 12px; color: #94a3b8;">•</span>
-                    <span style="font-size: 12px; color: #94a3b8;">{published}</span>
-                </div>
-                <h4 style="margin: 0; font-size: 16px; font-weight: 600; color: #1e293b;">
-                    {title}
-                </h4>
-            </div>
-            <span style="font-size: 20px; margin-left: 12px;">{sentiment_emoji}</span>
-        </div>
-    </div>
-    '''
-
-    st.markdown(card_html, unsafe_allow_html=True)
+    parts = [
+        f'<div style="border-left: 4px solid {sentiment_color}; padding: 16px; margin-bottom: 16px; '
+        'background: #f8fafc; border-radius: 8px;">',
+        '<div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 8px;">',
+        '<div style="flex: 1;">',
+        '<div style="display: flex; align-items: center; gap: 8px; margin-bottom: 4px;">',
+        f'<span style="font-size: 12px; font-weight: 600; color: #64748b;">{source}</span>',
+        '<span style="font-size: 12px; color: #94a3b8;">•</span>',
+        f'<span style="font-size: 12px; color: #94a3b8;">{published}</span>',
+        '</div>',
+        f'<h4 style="margin: 0; font-size: 16px; font-weight: 600; color: #1e293b;">{title}</h4>',
+        '</div>',
+        f'<span style="font-size: 20px; margin-left: 12px;">{sentiment_emoji}</span>',
+        '</div>',
+        '</div>',
+    ]
 
     if show_description and description:
-        st.markdown(f"<p style='color: #64748b; font-size: 14px; margin-top: -8px; margin-bottom: 8px;'>{description}</p>", unsafe_allow_html=True)
+        parts.append(
+            "<p style='color: #64748b; font-size: 14px; margin-top: -8px; margin-bottom: 8px;'>"
+            f"{description}</p>"
+        )
+
+    if url and url != '#':
+        parts.append(
+            f'<a href="{html.escape(url)}" target="_blank" rel="noopener noreferrer" '
+            'style="display: inline-block; padding: 6px 16px; margin-bottom: 24px; border: 1px solid #cbd5e1; '
+            'border-radius: 8px; color: #1e293b; font-size: 14px; text-decoration: none;">Read More</a>'
+        )
+
+    return '\n'.join(parts)
+
+
+def render_news_card(article: Dict, show_description: bool = True):
+    """Render news article as a styled card
+
+    Args:
+        article: Article dictionary
+        show_description: Whether to show full description
+    """
+    st.markdown(build_news_card_html(article, show_description), unsafe_allow_html=True)
 
-    col1, col2 = st.columns([1, 5])
-    with col1:
-        if url and url != '#':
-            st.link_button("Read More", url, use_container_width=True)
+
+def render_news_list(articles: List[Dict], show_description: bool = True):
+    """Render news articles as styled cards in a single element
+
+    Every Streamlit element is a separate message to the browser, so the
+    whole list is sent as one markdown block rather than one per card.
+
+    Args:
+        articles: List of article dictionaries
+        show_description: Whether to show full descriptions
+    """
+    if not articles:
+        return
+
+    cards_html = '\n'.join(build_news_card_html(article, show_description) for article in articles)
+    st.markdown(cards_html, unsafe_allow_html=True)
 
 
 def fetch_all_news(ticker: str, newsapi_key: Optional[str] = None,
                    alphavantage_key: Optional[str] = None) -> List[Dict]:
     """Fetch news from all available sources
 
+    The sources are queried concurrently, so a cache miss waits for the
+    slowest provider rather than for all of them in turn. Each provider's
+    response is cached on its own: articles for NEWS_CACHE_TTL, failures
+    and empty responses for the shorter NEWS_FAILURE_TTL, so reruns don't
+    hit the APIs while a failed source is still retried soon.
+
     Args:
         ticker: Stock ticker symbol
         newsapi_key: NewsAPI key
@@ -348,13 +584,17 @@ def fetch_all_news(ticker: str, newsapi_key: Optional[str] = None,
     """
     all_news = []
 
+    sources = []
     if newsapi_key:
-        newsapi_articles = fetch_news_from_newsapi(ticker, newsapi_key)
-        all_news.extend(newsapi_articles)
-
+        sources.append((fetch_news_from_newsapi, newsapi_key))
     if alphavantage_key:
-        av_articles = fetch_news_from_alphavantage(ticker, alphavantage_key)
-        all_news.extend(av_articles)
+        sources.append((fetch_news_from_alphavantage, alphavantage_key))
+
+    if sources:
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [executor.submit(request, ticker, key) for request, key in sources]
+            for future in futures:
+                all_news.extend(future.result())
 
     all_news = remove_duplicates(all_news)
 
@@ -373,15 +613,56 @@ def remove_duplicates(articles: List[Dict]) -> List[Dict]:
         De-duplicated list
     """
     seen_titles = set()
+    seen_shingles = []
     unique_articles = []
 
     for article in articles:
         title = article.get('title', '').lower().strip()
 
-        title_normalized = re.sub(r'[^\w\s]', '', title)
+        title_normalized = TITLE_PUNCTUATION_PATTERN.sub('', title)
+
+        if not title_normalized or title_normalized in seen_titles:
+            continue
+
+        shingles = get_title_shingles(title_normalized)
+        if any(is_similar_title(shingles, other) for other in seen_shingles):
+            continue
 
-        if title_normalized and title_normalized not in seen_titles:
-            seen_titles.add(title_normalized)
-            unique_articles.append(article)
+        seen_titles.add(title_normalized)
+        seen_shingles.append(shingles)
+        unique_articles.append(article)
 
     return unique_articles
+
+
+def get_title_shingles(title: str) -> frozenset:
+    """Split a normalized title into overlapping character shingles
+
+    Args:
+        title: Normalized article title
+
+    Returns:
+        Set of character n-grams
+    """
+    last_start = max(len(title) - TITLE_SHINGLE_SIZE, 0)
+    return frozenset(title[i:i + TITLE_SHINGLE_SIZE] for i in range(last_start + 1))
+
+
+def is_similar_title(shingles: frozenset, other: frozenset) -> bool:
+    """Check whether two titles' shingle sets are near-duplicates
+
+    Args:
+        shingles: Shingles of the first title
+        other: Shingles of the second title
+
+    Returns:
+        True if their Jaccard similarity reaches the threshold
+    """
+    smaller, larger = sorted((len(shingles), len(other)))
+
+    # Jaccard similarity can never exceed the ratio of the set sizes
+    if smaller < TITLE_SIMILARITY_THRESHOLD * larger:
+        return False
+
+    overlap = len(shingles & other)
+    return overlap >= TITLE_SIMILARITY_THRESHOLD * (len(shingles) + len(other) - overlap)
@@ -5,25 +5,27 @@ Supports multiple subreddits and weighted sentiment scoring based on engagement.
 """
 
 import streamlit as st
-import praw
 import re
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
+import numpy as np
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 import os
+import threading
+import time
 from pathlib import Path
 
-try:
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-    VADER_AVAILABLE = True
-except ImportError:
-    VADER_AVAILABLE = False
+from .keyword_utils import KeywordMatcher
+
+if TYPE_CHECKING:
+    import praw
 
-try:
-    from textblob import TextBlob
-    TEXTBLOB_AVAILABLE = True
-except ImportError:
-    TEXTBLOB_AVAILABLE = False
+# praw and the sentiment libraries are imported on first use; TextBlob
+# alone pulls in NLTK, which noticeably slows loading this module
+VADER_AVAILABLE = find_spec('vaderSentiment') is not None
+TEXTBLOB_AVAILABLE = find_spec('textblob') is not None
 
 
 # Ticker mapping for common stocks
@@ -50,6 +52,65 @@ TICKER_MAPPING = {
     'VALE3': ['Vale', 'VALE3', '$VALE3'],
 }
 
+# Upper-cased search terms per ticker, for case-insensitive substring checks
+TICKER_TERMS_UPPER = {
+    ticker: tuple(dict.fromkeys(term.upper() for term in terms))
+    for ticker, terms in TICKER_MAPPING.items()
+}
+
+# Tickers for each upper-cased term; a term can name several tickers
+TICKERS_BY_TERM = {
+    term: tuple(ticker for ticker, terms in TICKER_TERMS_UPPER.items() if term in terms)
+    for terms in TICKER_TERMS_UPPER.values()
+    for term in terms
+}
+
+TICKER_TERM_MATCHER = KeywordMatcher(TICKERS_BY_TERM)
+
+# Keywords for the simple sentiment fallback
+BULLISH_KEYWORDS = frozenset([
+    'buy', 'bull', 'calls', 'moon', 'rocket', 'gain', 'profit',
+    'up', 'rise', 'surge', 'rally', 'strong', 'bullish', 'long'
+])
+BEARISH_KEYWORDS = frozenset([
+    'sell', 'bear', 'puts', 'crash', 'loss', 'down', 'fall',
+    'drop', 'decline', 'weak', 'bearish', 'short'
+])
+SENTIMENT_KEYWORD_MATCHER = KeywordMatcher(BULLISH_KEYWORDS | BEARISH_KEYWORDS)
+
+DOLLAR_TICKER_PATTERN = re.compile(r'\$([A-Z]{1,5})\b')
+
+# Worker threads (each with its own PRAW instance) per RedditClient
+REDDIT_WORKERS = 4
+
+# Used by clean_text, applied in this order
+URL_PATTERN = re.compile(r'http\S+|www\S+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+MARKDOWN_PATTERN = re.compile(r'[*_~`]')
+
+# Scores at or beyond +/- this count as bullish/bearish
+SENTIMENT_THRESHOLD = 0.15
+
+# Indexed by get_sentiment_index: neutral, bullish, bearish
+SENTIMENT_LABELS = ('neutral', 'bullish', 'bearish')
+SENTIMENT_DISPLAY_LABELS = ('Neutral', 'Bullish', 'Bearish')
+SENTIMENT_EMOJIS = ('⚪', '🟢', '🔴')
+SENTIMENT_COLORS = ('#6b7280', '#10b981', '#ef4444')
+
+
+@lru_cache(maxsize=256)
+def get_dollar_ticker_pattern(ticker: str) -> re.Pattern:
+    """Get the compiled case-insensitive $TICKER pattern for a ticker"""
+    return re.compile(rf'\${ticker}\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def get_vader_analyzer():
+    """Get the shared VADER analyzer, loading its lexicon on first use"""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer()
+
 
 class RedditClient:
     """Client for fetching Reddit posts"""
@@ -71,15 +132,35 @@ class RedditClient:
         self.reddit = None
         if self.client_id and self.client_secret:
             try:
-                self.reddit = praw.Reddit(
-                    client_id=self.client_id,
-                    client_secret=self.client_secret,
-                    user_agent=self.user_agent
-                )
+                self.reddit = self._create_reddit()
             except Exception as e:
                 st.warning(f"Failed to initialize Reddit client: {e}")
 
-    @st.cache_data(ttl=900)
+        # This client is shared across sessions and PRAW instances are not
+        # thread-safe, so all Reddit requests run on this long-lived pool.
+        # Each worker thread keeps its own PRAW instance (and OAuth token)
+        # for the life of the pool, so fetches don't re-authenticate.
+        self._executor = ThreadPoolExecutor(max_workers=REDDIT_WORKERS, thread_name_prefix='reddit')
+        self._worker_state = threading.local()
+
+    def _create_reddit(self) -> 'praw.Reddit':
+        """Create a PRAW instance with this client's credentials"""
+        import praw
+
+        return praw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent
+        )
+
+    def _get_worker_reddit(self) -> 'praw.Reddit':
+        """Get the PRAW instance owned by the current worker thread"""
+        reddit = getattr(self._worker_state, 'reddit', None)
+        if reddit is None:
+            reddit = self._worker_state.reddit = self._create_reddit()
+        return reddit
+
+    @st.cache_data(ttl=1800)
     def fetch_posts(_self, ticker: str, subreddits: List[str],
                     limit: int = 50, time_filter: str = 'day') -> List[Dict]:
         """Fetch posts mentioning a ticker from subreddits
@@ -96,55 +177,45 @@ class RedditClient:
         if not _self.reddit:
             return []
 
-        all_posts = []
-        search_terms = _self._get_search_terms(ticker)
+        search_terms = _self._get_search_terms(ticker)[:2]  # Limit to 2 terms to avoid rate limits
+        searches = [(name, term) for name in subreddits for term in search_terms]
 
-        for subreddit_name in subreddits:
-            try:
-                subreddit = _self.reddit.subreddit(subreddit_name)
-
-                # Search for ticker mentions
-                for search_term in search_terms[:2]:  # Limit to 2 terms to avoid rate limits
-                    posts = subreddit.search(
-                        search_term,
-                        time_filter=time_filter,
-                        limit=limit
-                    )
-
-                    for post in posts:
-                        # Check if ticker is actually mentioned
-                        text = f"{post.title} {post.selftext}"
-                        if _self._contains_ticker(text, ticker):
-                            post_data = {
-                                'id': post.id,
-                                'title': post.title,
-                                'text': post.selftext,
-                                'ticker': ticker,
-                                'subreddit': subreddit_name,
-                                'created_utc': post.created_utc,
-                                'upvotes': post.score,
-                                'num_comments': post.num_comments,
-                                'awards': post.total_awards_received,
-                                'url': f"https://reddit.com{post.permalink}",
-                                'author': str(post.author) if post.author else '[deleted]'
-                            }
-                            all_posts.append(post_data)
+        if not searches:
+            return []
 
+        # Each search is a network round trip, so run them concurrently
+        def run_search(search):
+            subreddit_name, search_term = search
+            found = []
+            try:
+                _self._search_subreddit(
+                    _self._get_worker_reddit(), subreddit_name, search_term,
+                    ticker, limit, time_filter, found
+                )
             except Exception as e:
-                st.warning(f"Error fetching from r/{subreddit_name}: {e}")
-                continue
+                return found, e
+            return found, None
 
-        # Remove duplicates
+        all_posts = []
         seen_ids = set()
-        unique_posts = []
-        for post in all_posts:
-            if post['id'] not in seen_ids:
+        failed_subreddits = set()
+
+        # map keeps submission order, so the first copy of a post wins
+        # exactly as in a serial loop
+        for (subreddit_name, _), (found, error) in zip(searches, _self._executor.map(run_search, searches)):
+            for post in found:
+                if post['id'] in seen_ids:
+                    continue
                 seen_ids.add(post['id'])
-                unique_posts.append(post)
+                all_posts.append(post)
+
+            if error is not None and subreddit_name not in failed_subreddits:
+                failed_subreddits.add(subreddit_name)
+                st.warning(f"Error fetching from r/{subreddit_name}: {error}")
 
-        return unique_posts
+        return all_posts
 
-    @st.cache_data(ttl=900)
+    @st.cache_data(ttl=1800)
     def fetch_trending_tickers(_self, subreddits: List[str],
                                limit: int = 100) -> List[Tuple[str, int]]:
         """Fetch trending tickers from subreddits
@@ -159,24 +230,60 @@ class RedditClient:
         if not _self.reddit:
             return []
 
-        ticker_mentions = Counter()
-
-        for subreddit_name in subreddits:
+        def count_mentions(subreddit_name):
+            mentions = Counter()
             try:
-                subreddit = _self.reddit.subreddit(subreddit_name)
+                subreddit = _self._get_worker_reddit().subreddit(subreddit_name)
                 posts = subreddit.hot(limit=limit)
 
+                # Each post counts once per ticker it mentions
                 for post in posts:
-                    text = f"{post.title} {post.selftext}"
-                    tickers = _self._extract_tickers(text)
-                    for ticker in tickers:
-                        ticker_mentions[ticker] += 1
+                    mentions.update(_self._extract_tickers(f"{post.title} {post.selftext}"))
 
             except Exception:
-                continue
+                pass
+            return mentions
+
+        # Merged in subreddit order, so ties rank as in a serial scan
+        ticker_mentions = Counter()
+        for mentions in _self._executor.map(count_mentions, subreddits):
+            ticker_mentions.update(mentions)
 
         return ticker_mentions.most_common(20)
 
+    def _search_subreddit(self, reddit: 'praw.Reddit', subreddit_name: str,
+                          search_term: str, ticker: str, limit: int,
+                          time_filter: str, found: List[Dict]):
+        """Search one subreddit for a term, appending posts that mention the ticker
+
+        Posts are appended as they arrive, so those found before an error
+        are kept.
+        """
+        subreddit = reddit.subreddit(subreddit_name)
+        posts = subreddit.search(
+            search_term,
+            time_filter=time_filter,
+            limit=limit
+        )
+
+        for post in posts:
+            # Check if ticker is actually mentioned
+            text = f"{post.title} {post.selftext}"
+            if self._contains_ticker(text, ticker):
+                found.append({
+                    'id': post.id,
+                    'title': post.title,
+                    'text': post.selftext,
+                    'ticker': ticker,
+                    'subreddit': subreddit_name,
+                    'created_utc': post.created_utc,
+                    'upvotes': post.score,
+                    'num_comments': post.num_comments,
+                    'awards': post.total_awards_received,
+                    'url': f"https://reddit.com{post.permalink}",
+                    'author': str(post.author) if post.author else '[deleted]'
+                })
+
     def _get_search_terms(self, ticker: str) -> List[str]:
         """Get search terms for a ticker"""
         terms = TICKER_MAPPING.get(ticker, [ticker])
@@ -184,36 +291,29 @@ class RedditClient:
 
     def _contains_ticker(self, text: str, ticker: str) -> bool:
         """Check if text contains ticker mention"""
-        search_terms = self._get_search_terms(ticker)
+        search_terms = TICKER_TERMS_UPPER.get(ticker) or (ticker.upper(),)
         text_upper = text.upper()
 
         for term in search_terms:
-            if term.upper() in text_upper:
+            if term in text_upper:
                 return True
 
-        # Check for $TICKER pattern
-        if re.search(rf'\${ticker}\b', text, re.IGNORECASE):
+        # Check for $TICKER pattern, which can only match if there is a '$'
+        if '$' in text and get_dollar_ticker_pattern(ticker).search(text):
             return True
 
         return False
 
     def _extract_tickers(self, text: str) -> List[str]:
         """Extract ticker symbols from text"""
-        tickers = []
-
         # Extract $TICKER patterns
-        dollar_tickers = re.findall(r'\$([A-Z]{1,5})\b', text)
-        tickers.extend(dollar_tickers)
+        tickers = set(DOLLAR_TICKER_PATTERN.findall(text))
 
         # Check against known tickers
-        text_upper = text.upper()
-        for ticker, terms in TICKER_MAPPING.items():
-            for term in terms:
-                if term.upper() in text_upper:
-                    tickers.append(ticker)
-                    break
+        for term in TICKER_TERM_MATCHER.find(text.upper()):
+            tickers.update(TICKERS_BY_TERM[term])
 
-        return list(set(tickers))
+        return list(tickers)
 
 
 class SentimentAnalyzer:
@@ -228,7 +328,7 @@ class SentimentAnalyzer:
         self.method = method
 
         if method in ['vader', 'hybrid'] and VADER_AVAILABLE:
-            self.vader = SentimentIntensityAnalyzer()
+            self.vader = get_vader_analyzer()
         else:
             self.vader = None
 
@@ -237,6 +337,9 @@ class SentimentAnalyzer:
         else:
             self.use_textblob = False
 
+        # Posts often quote the same headline, so reuse earlier results
+        self._analyze_cleaned = lru_cache(maxsize=4096)(self._analyze_cleaned_text)
+
     def analyze_text(self, text: str) -> Dict[str, float]:
         """Analyze sentiment of text
 
@@ -249,8 +352,11 @@ class SentimentAnalyzer:
         if not text or not text.strip():
             return {'score': 0.0, 'label': 'neutral', 'confidence': 0.0}
 
-        cleaned_text = clean_text(text)
+        # Copy so callers can't alter the cached result
+        return dict(self._analyze_cleaned(clean_text(text)))
 
+    def _analyze_cleaned_text(self, cleaned_text: str) -> Dict[str, float]:
+        """Analyze sentiment of already cleaned text with the configured method"""
         if self.method == 'vader' and self.vader:
             return self._analyze_vader(cleaned_text)
         elif self.method == 'textblob' and self.use_textblob:
@@ -266,40 +372,16 @@ class SentimentAnalyzer:
         scores = self.vader.polarity_scores(text)
         compound = scores['compound']
 
-        if compound >= 0.15:
-            label = 'bullish'
-        elif compound <= -0.15:
-            label = 'bearish'
-        else:
-            label = 'neutral'
-
-        confidence = abs(compound)
-
-        return {
-            'score': compound,
-            'label': label,
-            'confidence': confidence
-        }
+        return build_sentiment_result(compound)
 
     def _analyze_textblob(self, text: str) -> Dict[str, float]:
         """TextBlob sentiment analysis"""
+        from textblob import TextBlob
+
         blob = TextBlob(text)
         polarity = blob.sentiment.polarity  # -1 to 1
 
-        if polarity >= 0.15:
-            label = 'bullish'
-        elif polarity <= -0.15:
-            label = 'bearish'
-        else:
-            label = 'neutral'
-
-        confidence = abs(polarity)
-
-        return {
-            'score': polarity,
-            'label': label,
-            'confidence': confidence
-        }
+        return build_sentiment_result(polarity)
 
     def _analyze_hybrid(self, text: str) -> Dict[str, float]:
         """Hybrid analysis combining VADER and TextBlob"""
@@ -309,47 +391,18 @@ class SentimentAnalyzer:
         # Average the scores
         avg_score = (vader_result['score'] + textblob_result['score']) / 2
 
-        if avg_score >= 0.15:
-            label = 'bullish'
-        elif avg_score <= -0.15:
-            label = 'bearish'
-        else:
-            label = 'neutral'
-
-        confidence = abs(avg_score)
-
-        return {
-            'score': avg_score,
-            'label': label,
-            'confidence': confidence
-        }
+        return build_sentiment_result(avg_score)
 
     def _analyze_simple(self, text: str) -> Dict[str, float]:
         """Simple keyword-based sentiment"""
-        bullish_words = ['buy', 'bull', 'calls', 'moon', 'rocket', 'gain', 'profit',
-                        'up', 'rise', 'surge', 'rally', 'strong', 'bullish', 'long']
-        bearish_words = ['sell', 'bear', 'puts', 'crash', 'loss', 'down', 'fall',
-                        'drop', 'decline', 'weak', 'bearish', 'short']
-
-        text_lower = text.lower()
-        bullish_count = sum(1 for word in bullish_words if word in text_lower)
-        bearish_count = sum(1 for word in bearish_words if word in text_lower)
+        found = SENTIMENT_KEYWORD_MATCHER.find(text.lower())
+        bullish_count = len(found & BULLISH_KEYWORDS)
+        bearish_count = len(found & BEARISH_KEYWORDS)
 
         score = (bullish_count - bearish_count) / max(len(text.split()), 1)
         score = max(-1, min(1, score * 5))  # Normalize to -1 to 1
 
-        if score >= 0.15:
-            label = 'bullish'
-        elif score <= -0.15:
-            label = 'bearish'
-        else:
-            label = 'neutral'
-
-        return {
-            'score': score,
-            'label': label,
-            'confidence': abs(score)
-        }
+        return build_sentiment_result(score)
 
     def batch_analyze(self, posts: List[Dict]) -> List[Dict]:
         """Analyze sentiment for multiple posts
@@ -358,15 +411,18 @@ class SentimentAnalyzer:
             posts: List of post dictionaries
 
         Returns:
-            Posts with added sentiment data
+            Posts with added sentiment, engagement and weight data
         """
         for post in posts:
             text = f"{post.get('title', '')} {post.get('text', '')}"
             sentiment = self.analyze_text(text)
+            upvotes = post.get('upvotes', 0)
+            num_comments = post.get('num_comments', 0)
             post['sentiment'] = sentiment
+            post['engagement'] = upvotes + num_comments
             post['weight'] = calculate_post_weight(
-                post.get('upvotes', 0),
-                post.get('num_comments', 0),
+                upvotes,
+                num_comments,
                 post.get('awards', 0)
             )
 
@@ -392,18 +448,16 @@ class SentimentAnalyzer:
                 'total_engagement': 0
             }
 
-        scores = [p['sentiment']['score'] for p in posts if 'sentiment' in p]
-        weights = [p.get('weight', 1.0) for p in posts]
-
-        avg_sentiment = sum(scores) / len(scores) if scores else 0.0
-        weighted_sentiment = sum(s * w for s, w in zip(scores, weights)) / sum(weights) if weights else 0.0
+        # Extract scores and weights once, then reduce in a single vectorized pass
+        scored = [p for p in posts if 'sentiment' in p]
+        count = len(scored)
+        scores = np.fromiter((p['sentiment']['score'] for p in scored), dtype=np.float64, count=count)
+        weights = np.fromiter((p.get('weight', 1.0) for p in scored), dtype=np.float64, count=count)
 
-        bullish = sum(1 for p in posts if p.get('sentiment', {}).get('label') == 'bullish')
-        neutral = sum(1 for p in posts if p.get('sentiment', {}).get('label') == 'neutral')
-        bearish = sum(1 for p in posts if p.get('sentiment', {}).get('label') == 'bearish')
+        avg_sentiment, weighted_sentiment, bullish, bearish = _aggregate_scores(scores, weights)
 
         total_engagement = sum(
-            p.get('upvotes', 0) + p.get('num_comments', 0)
+            p['engagement'] if 'engagement' in p else p.get('upvotes', 0) + p.get('num_comments', 0)
             for p in posts
         )
 
@@ -412,7 +466,7 @@ class SentimentAnalyzer:
             'weighted_sentiment': weighted_sentiment,
             'total_posts': len(posts),
             'bullish_count': bullish,
-            'neutral_count': neutral,
+            'neutral_count': count - bullish - bearish,
             'bearish_count': bearish,
             'total_engagement': total_engagement
         }
@@ -420,19 +474,36 @@ class SentimentAnalyzer:
 
 # Utility functions
 
+def _aggregate_scores(scores: np.ndarray, weights: np.ndarray) -> Tuple[float, float, int, int]:
+    """Reduce sentiment scores to (mean, weighted mean, bullish count, bearish count)
+
+    Bullish/bearish use the same SENTIMENT_THRESHOLD as the analyzers' labels.
+    """
+    if not scores.size:
+        return 0.0, 0.0, 0, 0
+
+    avg = float(scores.mean())
+    weight_sum = weights.sum()
+    weighted = float(scores @ weights / weight_sum) if weight_sum > 0 else avg
+    bullish = int(np.count_nonzero(scores >= SENTIMENT_THRESHOLD))
+    bearish = int(np.count_nonzero(scores <= -SENTIMENT_THRESHOLD))
+
+    return avg, weighted, bullish, bearish
+
+
 def clean_text(text: str) -> str:
     """Clean text for sentiment analysis"""
     if not text:
         return ""
 
     # Remove URLs
-    text = re.sub(r'http\S+|www\S+', '', text)
+    text = URL_PATTERN.sub('', text)
 
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
 
     # Remove markdown formatting
-    text = re.sub(r'[*_~`]', '', text)
+    text = MARKDOWN_PATTERN.sub('', text)
 
     return text.strip()
 
@@ -450,49 +521,47 @@ def calculate_post_weight(upvotes: int, comments: int, awards: int) -> float:
     return min(weight, 1.0)  # Cap at 1.0
 
 
+def get_sentiment_index(score: float) -> int:
+    """Get the SENTIMENT_* tuple index for a score: 0 neutral, 1 bullish, 2 bearish"""
+    return (score >= SENTIMENT_THRESHOLD) + 2 * (score <= -SENTIMENT_THRESHOLD)
+
+
+def build_sentiment_result(score: float) -> Dict[str, float]:
+    """Build the analyzer result dict for a score"""
+    return {
+        'score': score,
+        'label': SENTIMENT_LABELS[get_sentiment_index(score)],
+        'confidence': abs(score)
+    }
+
+
 def get_sentiment_emoji(score: float) -> str:
     """Get emoji for sentiment score"""
-    if score >= 0.15:
-        return '🟢'
-    elif score <= -0.15:
-        return '🔴'
-    else:
-        return '⚪'
+    return SENTIMENT_EMOJIS[get_sentiment_index(score)]
 
 
 def get_sentiment_color(score: float) -> str:
     """Get color for sentiment score"""
-    if score >= 0.15:
-        return '#10b981'  # Green
-    elif score <= -0.15:
-        return '#ef4444'  # Red
-    else:
-        return '#6b7280'  # Gray
+    return SENTIMENT_COLORS[get_sentiment_index(score)]
 
 
 def get_sentiment_label(score: float) -> str:
     """Get label for sentiment score"""
-    if score >= 0.15:
-        return 'Bullish'
-    elif score <= -0.15:
-        return 'Bearish'
-    else:
-        return 'Neutral'
+    return SENTIMENT_DISPLAY_LABELS[get_sentiment_index(score)]
 
 
 def format_timeago(timestamp: float) -> str:
     """Format timestamp as time ago"""
-    now = datetime.now()
-    post_time = datetime.fromtimestamp(timestamp)
-    diff = now - post_time
-
-    if diff.days > 0:
-        return f"{diff.days}d ago"
-    elif diff.seconds >= 3600:
-        hours = diff.seconds // 3600
+    # Same day/second split as subtracting datetimes, without building them
+    days, seconds = divmod(time.time() - timestamp, 86400)
+
+    if days > 0:
+        return f"{int(days)}d ago"
+    elif seconds >= 3600:
+        hours = int(seconds // 3600)
         return f"{hours}h ago"
-    elif diff.seconds >= 60:
-        minutes = diff.seconds // 60
+    elif seconds >= 60:
+        minutes = int(seconds // 60)
         return f"{minutes}m ago"
     else:
         return "just now"